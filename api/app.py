@@ -1,18 +1,43 @@
 import os
 import sys
 import datetime
+import gc
 import subprocess
 import json
+import mimetypes
 import re
 import difflib
+import itertools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import uuid
+import time
+import hashlib
 import shutil
-import requests
+import struct
+import tempfile
+import wave
+import queue
 import random
+from collections import OrderedDict
 from pathlib import Path
-from urllib.parse import urlencode
-from flask import Flask, render_template, request, jsonify, Response, send_from_directory
+from urllib.parse import quote, urlencode
+from flask import Flask, render_template, request, jsonify, Response, abort, send_from_directory
+from werkzeug.security import safe_join
+
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    av = None
+    PYAV_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # Ensure project root is in path for imports
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -68,6 +93,7 @@ from api.reading_evaluator import (
 )
 from pte_core.asr.phoneme_recognition import call_phoneme_service
 from pte_core.scoring.accent_scorer import AccentTolerantScorer
+from api.job_store import ShardedJobStore, new_job_id
 from api.file_utils import (
     get_paired_paths,
     get_temp_filepath,
@@ -92,7 +118,7 @@ from src.shared.paths import (
     ensure_runtime_dirs,
     USER_UPLOADS_DIR,
 )
-from src.shared.services import GRAMMAR_SERVICE_URL
+from src.shared.services import GRAMMAR_SERVICE_URL, get_service_session
 
 app = Flask(__name__)
 IMAGES_DIR = os.fspath(SHARED_IMAGES_DIR)
@@ -104,10 +130,109 @@ ensure_runtime_dirs()
 # ============================================================================
 # JOB QUEUE SYSTEM
 # ============================================================================
-JOB_STORE = {}  # {job_id: {status, result, error, audio_path, text_path}}
-IMAGE_JOB_STORE = {}  # {job_id: {status, result, error, image_id, audio_path}}
-LECTURE_JOB_STORE = {}  # {job_id: {status, result, error, lecture_id, audio_path}}
+try:
+    JOB_STORE_MAX_ENTRIES = max(1, int(os.environ.get("PTE_JOB_STORE_MAX_ENTRIES", "1024")))
+except ValueError:
+    JOB_STORE_MAX_ENTRIES = 1024
+JOB_STORE = ShardedJobStore(max_entries=JOB_STORE_MAX_ENTRIES)  # {job_id: {status, result, error, audio_path, text_path}}
+IMAGE_JOB_STORE = ShardedJobStore(max_entries=JOB_STORE_MAX_ENTRIES)  # {job_id: {status, result, error, image_id, audio_path}}
+LECTURE_JOB_STORE = ShardedJobStore(max_entries=JOB_STORE_MAX_ENTRIES)  # {job_id: {status, result, error, lecture_id, audio_path}}
+try:
+    JOB_TTL_SECONDS = max(1, int(os.environ.get("PTE_JOB_TTL_SECONDS", "600")))
+except ValueError:
+    JOB_TTL_SECONDS = 600
+JOB_SWEEP_INTERVAL = min(60, JOB_TTL_SECONDS)
+_job_sweeper_started = False
+_job_sweeper_lock = threading.Lock()
+
+
+def _sweep_job_stores():
+    """Drop finished jobs nobody has polled for JOB_TTL_SECONDS."""
+    while True:
+        time.sleep(JOB_SWEEP_INTERVAL)
+        try:
+            for store in (JOB_STORE, IMAGE_JOB_STORE, LECTURE_JOB_STORE):
+                store.sweep(JOB_TTL_SECONDS)
+        except Exception as e:
+            print(f"Job sweeper error: {e}")
+
+
+def _ensure_job_sweeper():
+    """Start the TTL sweeper on first job submission (after any gunicorn fork)."""
+    global _job_sweeper_started
+    if _job_sweeper_started:
+        return
+    with _job_sweeper_lock:
+        if _job_sweeper_started:
+            return
+        threading.Thread(target=_sweep_job_stores, name="pte-job-sweeper", daemon=True).start()
+        _job_sweeper_started = True
+
+
+def _pool_size_env(name, default):
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+# Bounded worker pools, one per feature: reuse threads across jobs and keep a
+# slow MFA backlog from delaying image/lecture jobs (and vice versa). MFA jobs
+# are CPU/docker heavy; image and lecture jobs mostly wait on the ASR HTTP service.
+JOB_POOL_SIZES = {
+    "mfa": _pool_size_env("PTE_MFA_POOL_WORKERS", 2),
+    "image": _pool_size_env("PTE_IMAGE_POOL_WORKERS", 8),
+    "lecture": _pool_size_env("PTE_LECTURE_POOL_WORKERS", 8),
+}
+JOB_POOLS = {
+    name: ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"pte-{name}")
+    for name, size in JOB_POOL_SIZES.items()
+}
+JOB_QUEUE_FACTOR = _pool_size_env("PTE_JOB_QUEUE_FACTOR", 4)
+# Running + queued jobs per pool; submissions beyond max_workers * (1 + factor) get a 503.
+_JOB_POOL_PENDING = {name: 0 for name in JOB_POOLS}
+_JOB_POOL_LIMITS = {name: size * (1 + JOB_QUEUE_FACTOR) for name, size in JOB_POOL_SIZES.items()}
+_JOB_POOL_LOCK = threading.Lock()
+
+
+def _reserve_job_slot(name):
+    """
+    Claim a backlog slot in the feature's pool; False when it is full. The check and
+    the claim happen under one lock so concurrent requests cannot overshoot the limit.
+    Pass the slot to _submit_job, or give it back with _job_pool_done if the job is never submitted.
+    """
+    with _JOB_POOL_LOCK:
+        if _JOB_POOL_PENDING[name] >= _JOB_POOL_LIMITS[name]:
+            return False
+        _JOB_POOL_PENDING[name] += 1
+        return True
+
+
+def _job_pool_done(name):
+    with _JOB_POOL_LOCK:
+        _JOB_POOL_PENDING[name] -= 1
+
+
+def _submit_job(name, fn, *args):
+    """
+    Submit into a slot claimed with _reserve_job_slot; the slot is released when the
+    job finishes. If submit raises, the slot stays with the caller to release.
+    """
+    future = JOB_POOLS[name].submit(fn, *args)
+    future.add_done_callback(lambda _future: _job_pool_done(name))
+    return future
+
+
+def _job_pool_busy_response():
+    return jsonify({"error": "Too many evaluations in progress. Please retry shortly."}), 503
+
+
 KEEP_UPLOAD_ARTIFACTS = os.environ.get("PTE_KEEP_UPLOAD_ARTIFACTS", "1").lower() not in {"0", "false", "no"}
+GRAMMAR_SESSION = get_service_session()  # keep-alive pool shared by /api/grammar calls
+GRAMMAR_HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length"}
+GRAMMAR_RESPONSE_CACHE = OrderedDict()  # {sha1(payload): (body, status, headers)}
+GRAMMAR_RESPONSE_CACHE_MAX = 512
+GRAMMAR_RESPONSE_CACHE_LOCK = threading.Lock()
 WORD_PRACTICE_ACCENT_MAP = {
     "Indian": "Indian English",
     "Nigerian": "Nigerian English",
@@ -343,15 +468,106 @@ def _build_select_missing_word_options(task: dict) -> list[dict]:
     return rebuilt
 
 
-def _maybe_cleanup(paths, force=False):
+def _json_dumps(payload):
+    """Serialize to a JSON string, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                payload,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(payload)
+
+
+def fast_jsonify(payload, status=200):
+    """
+    jsonify() equivalent for hot endpoints with large payloads (orjson when available).
+    The body is fully buffered, so Content-Length is always sent and status polls
+    never fall back to chunked framing.
+    """
+    body = _json_dumps(payload).encode("utf-8")
+    return Response(
+        body,
+        status=status,
+        mimetype='application/json',
+        headers={'Content-Length': str(len(body))},
+    )
+
+
+def _resolve_scratch_dir():
+    """Prefer tmpfs (/dev/shm) for short-lived scratch files; PTE_SCRATCH_DIR overrides."""
+    override = os.environ.get("PTE_SCRATCH_DIR", "").strip()
+    if override:
+        return override
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+SCRATCH_DIR = _resolve_scratch_dir()
+
+
+def _scratch_tempdir(prefix):
+    """Per-request temp dir that is removed on scope exit, including error paths."""
+    return tempfile.TemporaryDirectory(prefix=f"pte_{prefix}_", dir=SCRATCH_DIR)
+
+
+def _release_job_memory():
+    """Drop per-job garbage and cached CUDA blocks once a worker finishes."""
+    gc.collect()
+    torch_module = sys.modules.get("torch")
+    try:
+        if torch_module is not None and torch_module.cuda.is_available():
+            torch_module.cuda.empty_cache()
+    except Exception:
+        pass
+
+
+CLEANUP_QUEUE = queue.SimpleQueue()
+_cleanup_reaper_started = False
+_cleanup_reaper_lock = threading.Lock()
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        pass
+
+
+def _reap_cleanup_queue():
+    while True:
+        _remove_quietly(CLEANUP_QUEUE.get())
+
+
+def _ensure_cleanup_reaper():
+    global _cleanup_reaper_started
+    if _cleanup_reaper_started:
+        return
+    with _cleanup_reaper_lock:
+        if _cleanup_reaper_started:
+            return
+        threading.Thread(target=_reap_cleanup_queue, name="pte-cleanup", daemon=True).start()
+        _cleanup_reaper_started = True
+
+
+def _maybe_cleanup(paths, force=False, background=False):
+    """Delete attempt files unless artifacts are kept; background=True hands unlinks to a reaper thread."""
     if KEEP_UPLOAD_ARTIFACTS and not force:
         return
+    if background:
+        _ensure_cleanup_reaper()
     for candidate in paths:
-        try:
-            if candidate and os.path.exists(candidate):
-                os.remove(candidate)
-        except Exception:
-            pass
+        if not candidate:
+            continue
+        if background:
+            CLEANUP_QUEUE.put(candidate)
+        else:
+            _remove_quietly(candidate)
 
 
 def _persist_attempt_payload(audio_path, payload, filename):
@@ -437,30 +653,31 @@ def _persist_writing_result(task_slug, payload):
 def run_mfa_job(job_id, audio_path, text_path):
     """Background worker for MFA alignment using the main engine."""
     try:
-        JOB_STORE[job_id]['status'] = 'processing'
+        JOB_STORE.set_status(job_id, 'processing')
+        job = JOB_STORE.get(job_id) or {}
         
         # Get accent from job store
-        accent = JOB_STORE[job_id].get('accent', 'US_MFA')
+        accent = job.get('accent', 'US_MFA')
         
         # Use the main engine from validator.py
         result = align_and_validate(audio_path, text_path, accents=[accent])
         _persist_attempt_artifacts(audio_path, result, filename="check_result.json")
         
-        JOB_STORE[job_id]['status'] = 'complete'
-        JOB_STORE[job_id]['result'] = result
+        JOB_STORE.complete(job_id, result)
     except Exception as e:
         import traceback
         traceback.print_exc()
-        JOB_STORE[job_id]['status'] = 'failed'
-        JOB_STORE[job_id]['error'] = str(e)
+        JOB_STORE.fail(job_id, str(e))
     finally:
-        _maybe_cleanup([audio_path, text_path])
+        _maybe_cleanup([audio_path, text_path], background=True)
+        _release_job_memory()
 
 def run_image_evaluation_job(job_id, image_id, audio_path):
     """Background worker for image description evaluation with MFA phone analysis."""
     try:
-        IMAGE_JOB_STORE[job_id]['status'] = 'processing'
-        recording_seconds = IMAGE_JOB_STORE[job_id].get('recording_seconds')
+        IMAGE_JOB_STORE.set_status(job_id, 'processing')
+        job = IMAGE_JOB_STORE.get(job_id) or {}
+        recording_seconds = job.get('recording_seconds')
         
         # Transcribe audio using the main engine's ASR
         from pte_core.asr.voice2text import voice2text
@@ -468,15 +685,16 @@ def run_image_evaluation_job(job_id, image_id, audio_path):
         transcription = asr_result.get('text', '').strip()
         word_timestamps = asr_result.get('word_timestamps', [])
         
-        # Create temporary text file for MFA alignment
-        temp_text_path = audio_path.replace('.wav', '_transcript.txt')
-        with open(temp_text_path, 'w', encoding='utf-8') as f:
-            f.write(transcription)
-        
-        # Run MFA alignment to get phone-level data
+        # Run MFA alignment against the in-memory transcript, reusing the ASR result
         from api.validator import align_and_validate
-        accent = IMAGE_JOB_STORE[job_id].get('accent', 'US_MFA')
-        mfa_result = align_and_validate(audio_path, temp_text_path, accents=[accent])
+        accent = job.get('accent', 'US_MFA')
+        mfa_result = align_and_validate(
+            audio_path,
+            None,
+            accents=[accent],
+            reference_text=transcription,
+            asr_result=asr_result,
+        )
         _persist_attempt_artifacts(audio_path, mfa_result, filename="image_mfa_result.json")
         
         # Evaluate description (pass MFA words so pronunciation score is computed)
@@ -497,22 +715,22 @@ def run_image_evaluation_job(job_id, image_id, audio_path):
             'word_feedback': mfa_result.get('word_feedback', {}) if mfa_result else {},
         }
         
-        IMAGE_JOB_STORE[job_id]['status'] = 'complete'
-        IMAGE_JOB_STORE[job_id]['result'] = result
+        IMAGE_JOB_STORE.complete(job_id, result)
         _persist_attempt_payload(audio_path, result, "image_evaluation_result.json")
     except Exception as e:
         import traceback
         traceback.print_exc()
-        IMAGE_JOB_STORE[job_id]['status'] = 'failed'
-        IMAGE_JOB_STORE[job_id]['error'] = str(e)
+        IMAGE_JOB_STORE.fail(job_id, str(e))
     finally:
-        _maybe_cleanup([audio_path, temp_text_path if 'temp_text_path' in locals() else None])
+        _maybe_cleanup([audio_path], background=True)
+        _release_job_memory()
 
 def run_lecture_evaluation_job(job_id, lecture_id, audio_path):
     """Background worker for lecture evaluation with MFA phone analysis."""
     try:
-        LECTURE_JOB_STORE[job_id]['status'] = 'processing'
-        recording_seconds = LECTURE_JOB_STORE[job_id].get('recording_seconds')
+        LECTURE_JOB_STORE.set_status(job_id, 'processing')
+        job = LECTURE_JOB_STORE.get(job_id) or {}
+        recording_seconds = job.get('recording_seconds')
         
         # Transcribe audio using the main engine's ASR
         from pte_core.asr.voice2text import voice2text
@@ -520,15 +738,16 @@ def run_lecture_evaluation_job(job_id, lecture_id, audio_path):
         transcription = asr_result.get('text', '').strip()
         word_timestamps = asr_result.get('word_timestamps', [])
         
-        # Create temporary text file for MFA alignment
-        temp_text_path = audio_path.replace('.wav', '_transcript.txt')
-        with open(temp_text_path, 'w', encoding='utf-8') as f:
-            f.write(transcription)
-        
-        # Run MFA alignment to get phone-level data
+        # Run MFA alignment against the in-memory transcript, reusing the ASR result
         from api.validator import align_and_validate
-        accent = LECTURE_JOB_STORE[job_id].get('accent', 'US_MFA')
-        mfa_result = align_and_validate(audio_path, temp_text_path, accents=[accent])
+        accent = job.get('accent', 'US_MFA')
+        mfa_result = align_and_validate(
+            audio_path,
+            None,
+            accents=[accent],
+            reference_text=transcription,
+            asr_result=asr_result,
+        )
         _persist_attempt_artifacts(audio_path, mfa_result, filename="lecture_mfa_result.json")
         
         # Use MFA words directly (they already contain timing and status)
@@ -550,38 +769,91 @@ def run_lecture_evaluation_job(job_id, lecture_id, audio_path):
             'word_feedback': mfa_result.get('word_feedback', {}) if mfa_result else {},
         }
         
-        LECTURE_JOB_STORE[job_id]['status'] = 'complete'
-        LECTURE_JOB_STORE[job_id]['result'] = result
+        LECTURE_JOB_STORE.complete(job_id, result)
         _persist_attempt_payload(audio_path, result, "lecture_evaluation_result.json")
     except Exception as e:
         import traceback
         traceback.print_exc()
-        LECTURE_JOB_STORE[job_id]['status'] = 'failed'
-        LECTURE_JOB_STORE[job_id]['error'] = str(e)
+        LECTURE_JOB_STORE.fail(job_id, str(e))
     finally:
-        _maybe_cleanup([audio_path, temp_text_path if 'temp_text_path' in locals() else None])
+        _maybe_cleanup([audio_path], background=True)
+        _release_job_memory()
 
 # ============================================================================
 # UTILITY
 # ============================================================================
+# Cap concurrent ffmpeg subprocesses so an upload burst queues instead of
+# oversubscribing the CPU; the 10s conversion timeout starts once a slot is held.
+FFMPEG_SEM = threading.BoundedSemaphore(
+    _pool_size_env("PTE_FFMPEG_SLOTS", max(1, (os.cpu_count() or 1) // 2))
+)
+
+# A mono 16kHz resample of a short clip gains nothing from ffmpeg's thread pool,
+# and only errors are worth capturing from stderr. Our own fds are non-inheritable
+# (PEP 446), so subprocesses can skip the close_fds sweep.
+FFMPEG_BASE_ARGS = ['ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error', '-threads', '1', '-y']
+
+
+def _decode_to_wav_inprocess(source, output_path):
+    """Decode and resample audio (path or file object) to 16kHz mono WAV in-process via PyAV (libav)."""
+    resampler = av.AudioResampler(format='s16', layout='mono', rate=16000)
+    with av.open(source) as container, wave.open(output_path, 'wb') as out_file:
+        out_file.setnchannels(1)
+        out_file.setsampwidth(2)
+        out_file.setframerate(16000)
+        # Passing None flushes any samples still buffered in the resampler.
+        for frame in itertools.chain(container.decode(audio=0), [None]):
+            resampled = resampler.resample(frame)
+            if not isinstance(resampled, list):
+                resampled = [resampled] if resampled is not None else []
+            for chunk in resampled:
+                out_file.writeframes(chunk.to_ndarray().tobytes())
+    return True
+
+
+def _is_already_target_wav(header):
+    """True when a canonical 44-byte RIFF header already describes 16kHz mono 16-bit PCM."""
+    if len(header) < 44 or header[:4] != b'RIFF' or header[8:16] != b'WAVEfmt ':
+        return False
+    audio_format, channels, sample_rate = struct.unpack('<HHI', header[20:28])
+    bits_per_sample = struct.unpack('<H', header[34:36])[0]
+    return (audio_format, channels, sample_rate, bits_per_sample) == (1, 1, 16000, 16)
+
+
 def convert_to_wav(input_path, output_path):
-    """Convert audio to 16kHz mono WAV using ffmpeg."""
+    """Convert audio to 16kHz mono WAV, in-process when PyAV is available, else via ffmpeg."""
     try:
-        cmd = [
-            'ffmpeg', '-y',
+        with open(input_path, 'rb') as in_file:
+            if _is_already_target_wav(in_file.read(44)):
+                shutil.copyfile(input_path, output_path)
+                return True
+    except OSError:
+        pass
+
+    if PYAV_AVAILABLE:
+        try:
+            return _decode_to_wav_inprocess(input_path, output_path)
+        except Exception as e:
+            print(f"In-process decode failed, falling back to ffmpeg: {e}")
+
+    try:
+        cmd = FFMPEG_BASE_ARGS + [
             '-i', input_path,
             '-ac', '1',
             '-ar', '16000',
+            '-f', 'wav',
             output_path
         ]
         # Added timeout to prevent hanging and capture stderr for debugging
-        result = subprocess.run(
-            cmd, 
-            check=True, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            timeout=10
-        )
+        with FFMPEG_SEM:
+            result = subprocess.run(
+                cmd, 
+                check=True, 
+                stdout=subprocess.DEVNULL, 
+                stderr=subprocess.PIPE,
+                timeout=10,
+                close_fds=False,
+            )
         return True
     except subprocess.TimeoutExpired:
         print(f"Conversion timed out for {input_path}")
@@ -596,6 +868,78 @@ def convert_to_wav(input_path, output_path):
         print(f"Conversion error: {e}")
         return False
 
+def _pipe_stream_to_ffmpeg(in_stream, output_path):
+    """Feed an upload stream to ffmpeg's stdin and write 16kHz mono WAV to output_path."""
+    cmd = FFMPEG_BASE_ARGS + [
+        '-i', 'pipe:0',
+        '-ac', '1',
+        '-ar', '16000',
+        '-f', 'wav',
+        output_path
+    ]
+    # stderr goes to a temp file so a chatty ffmpeg can never block our stdin writes.
+    with FFMPEG_SEM, tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr_file, close_fds=False
+        )
+        try:
+            shutil.copyfileobj(in_stream, proc.stdin, 1024 * 1024)
+        except BrokenPipeError:
+            pass
+        finally:
+            proc.stdin.close()
+        try:
+            returncode = proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            print("Streamed conversion timed out")
+            return False
+        if returncode != 0:
+            stderr_file.seek(0)
+            print(f"FFmpeg Error: {stderr_file.read().decode('utf-8', errors='ignore')[-2000:]}")
+            return False
+    return True
+
+
+def convert_stream_to_wav(in_stream, output_path):
+    """
+    Convert an uploaded file stream to 16kHz mono WAV without first saving the raw upload.
+    Falls back to staging the upload on disk when the container cannot be read
+    from a pipe (e.g. MP4 recordings with a trailing moov atom).
+    """
+    header = in_stream.read(44)
+    in_stream.seek(0)
+    if _is_already_target_wav(header):
+        # Client already recorded 16kHz mono PCM; store it as-is.
+        with open(output_path, 'wb') as out_file:
+            shutil.copyfileobj(in_stream, out_file, 1024 * 1024)
+        return True
+
+    if PYAV_AVAILABLE:
+        try:
+            return _decode_to_wav_inprocess(in_stream, output_path)
+        except Exception as e:
+            print(f"In-process stream decode failed, falling back to ffmpeg: {e}")
+            in_stream.seek(0)
+
+    try:
+        if _pipe_stream_to_ffmpeg(in_stream, output_path):
+            return True
+    except Exception as e:
+        print(f"Streamed conversion error: {e}")
+
+    in_stream.seek(0)
+    # The staged copy is deleted right after conversion, so keep it on tmpfs
+    # when available instead of dirtying the upload volume's page cache.
+    staged_path = get_temp_filepath('upload', 'tmp', directory=SCRATCH_DIR or os.path.dirname(output_path))
+    try:
+        with open(staged_path, 'wb') as staged_file:
+            shutil.copyfileobj(in_stream, staged_file, 1024 * 1024)
+        return convert_to_wav(staged_path, output_path)
+    finally:
+        _maybe_cleanup([staged_path], force=True)
+
 # ============================================================================
 # ROUTES - MAIN DASHBOARD
 # ============================================================================
@@ -615,8 +959,29 @@ def check_grammar():
         if not data or 'text' not in data:
             return jsonify({"error": "No text provided"}), 400
             
-        response = requests.post(GRAMMAR_SERVICE_URL, json=data, timeout=10)
-        return (response.text, response.status_code, response.headers.items())
+        cache_key = hashlib.sha1(
+            json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        with GRAMMAR_RESPONSE_CACHE_LOCK:
+            cached = GRAMMAR_RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                GRAMMAR_RESPONSE_CACHE.move_to_end(cache_key)
+                return cached
+
+        response = GRAMMAR_SESSION.post(GRAMMAR_SERVICE_URL, json=data, timeout=10)
+        # Drop hop-by-hop/encoding headers; Flask sets Content-Length for the decoded body.
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in GRAMMAR_HOP_BY_HOP_HEADERS
+        ]
+        proxied = (response.text, response.status_code, headers)
+        if response.status_code == 200:
+            with GRAMMAR_RESPONSE_CACHE_LOCK:
+                GRAMMAR_RESPONSE_CACHE[cache_key] = proxied
+                while len(GRAMMAR_RESPONSE_CACHE) > GRAMMAR_RESPONSE_CACHE_MAX:
+                    GRAMMAR_RESPONSE_CACHE.popitem(last=False)
+        return proxied
     except Exception as e:
         return jsonify({"error": f"Grammar service unreachable: {str(e)}"}), 503
 
@@ -708,6 +1073,57 @@ def tts():
     response.headers["Cache-Control"] = "public, max-age=86400"
     return response
 
+def _score_word_practice(uploaded, clean_word, accent, scratch_dir):
+    """Convert the upload inside scratch_dir and score it against the word's expected phones."""
+    temp_input = os.path.join(scratch_dir, 'upload.webm')
+    temp_wav = os.path.join(scratch_dir, 'input.wav')
+    processing_path = temp_wav
+
+    if not convert_stream_to_wav(uploaded.stream, temp_wav):
+        # Let the phoneme service try the raw upload.
+        uploaded.stream.seek(0)
+        uploaded.save(temp_input)
+        processing_path = temp_input
+
+    builder = _get_word_practice_builder()
+    scorer = _get_word_practice_scorer()
+    expected_phones = builder.word_to_phonemes(clean_word)
+    observed_phones = call_phoneme_service(processing_path)
+
+    if not observed_phones:
+        return jsonify({
+            "error": "Could not detect phonemes from this recording. Please try again with clearer pronunciation."
+        }), 422
+
+    scoring_accent = _map_word_practice_accent(accent)
+    score_obj = scorer.score_word(expected_phones, observed_phones, scoring_accent)
+    accuracy = float(score_obj.get('accuracy', 0.0))
+    if accuracy >= 75:
+        status = "correct"
+    elif accuracy >= 55:
+        status = "acceptable"
+    else:
+        status = "mispronounced"
+
+    alignment = []
+    for exp, obs, score in score_obj.get('alignment', []):
+        alignment.append({
+            "expected": exp,
+            "observed": obs,
+            "score": round(float(score), 2)
+        })
+
+    return jsonify({
+        "word": clean_word,
+        "accent": scoring_accent,
+        "status": status,
+        "accuracy": round(accuracy, 1),
+        "expected_phones": " ".join(expected_phones),
+        "observed_phones": " ".join(observed_phones),
+        "alignment": alignment,
+        "method": "phoneme_service_only"
+    })
+
 @app.route('/api/word-practice', methods=['POST'])
 def word_practice():
     """
@@ -723,57 +1139,12 @@ def word_practice():
         return jsonify({"error": "No valid word provided"}), 400
 
     uploaded = request.files['audio']
-    temp_input = get_temp_filepath('word_practice', 'webm')
-    temp_wav = get_temp_filepath('word_practice', 'wav')
-    processing_path = temp_wav
 
     try:
-        uploaded.save(temp_input)
-        if not convert_to_wav(temp_input, temp_wav):
-            processing_path = temp_input
-
-        builder = _get_word_practice_builder()
-        scorer = _get_word_practice_scorer()
-        expected_phones = builder.word_to_phonemes(clean_word)
-        observed_phones = call_phoneme_service(processing_path)
-
-        if not observed_phones:
-            return jsonify({
-                "error": "Could not detect phonemes from this recording. Please try again with clearer pronunciation."
-            }), 422
-
-        scoring_accent = _map_word_practice_accent(accent)
-        score_obj = scorer.score_word(expected_phones, observed_phones, scoring_accent)
-        accuracy = float(score_obj.get('accuracy', 0.0))
-        if accuracy >= 75:
-            status = "correct"
-        elif accuracy >= 55:
-            status = "acceptable"
-        else:
-            status = "mispronounced"
-
-        alignment = []
-        for exp, obs, score in score_obj.get('alignment', []):
-            alignment.append({
-                "expected": exp,
-                "observed": obs,
-                "score": round(float(score), 2)
-            })
-
-        return jsonify({
-            "word": clean_word,
-            "accent": scoring_accent,
-            "status": status,
-            "accuracy": round(accuracy, 1),
-            "expected_phones": " ".join(expected_phones),
-            "observed_phones": " ".join(observed_phones),
-            "alignment": alignment,
-            "method": "phoneme_service_only"
-        })
+        with _scratch_tempdir('word_practice') as scratch_dir:
+            return _score_word_practice(uploaded, clean_word, accent, scratch_dir)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        _maybe_cleanup([temp_input, temp_wav], force=True)
 
 # ============================================================================
 # ROUTES - SPEAKING TASKS
@@ -897,9 +1268,29 @@ def get_repeat_sentence_task():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+STATIC_MEDIA_MAX_AGE = 86400
+# When set (e.g. "/_protected"), static media is handed to nginx via X-Accel-Redirect
+# instead of streaming the file through a WSGI thread.
+STATIC_ACCEL_PREFIX = os.environ.get("PTE_STATIC_ACCEL_PREFIX", "").strip().rstrip("/")
+
+
+def _send_static_media(directory, filename, accel_location):
+    """Serve reference media with ETag/Last-Modified validation so repeat loads get 304s."""
+    if STATIC_ACCEL_PREFIX:
+        file_path = safe_join(directory, filename)
+        if file_path is None or not os.path.isfile(file_path):
+            abort(404)
+        response = Response(mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream")
+        response.headers["X-Accel-Redirect"] = f"{STATIC_ACCEL_PREFIX}/{accel_location}/{quote(filename)}"
+        response.headers["Cache-Control"] = f"public, max-age={STATIC_MEDIA_MAX_AGE}"
+        return response
+    response = send_from_directory(directory, filename, conditional=True, etag=True, max_age=STATIC_MEDIA_MAX_AGE)
+    response.headers["Cache-Control"] = f"public, max-age={STATIC_MEDIA_MAX_AGE}"
+    return response
+
 @app.route('/audio/repeat-sentence/<path:filename>')
 def serve_repeat_sentence_audio(filename):
-    return send_from_directory(REPEAT_SENTENCE_AUDIO_DIR, filename)
+    return _send_static_media(REPEAT_SENTENCE_AUDIO_DIR, filename, "repeat-sentence-audio")
 
 @app.route('/speaking/describe-image')
 def describe_image_speaking():
@@ -1708,14 +2099,11 @@ def save():
     feature = request.form.get('feature', FEATURE_READ_ALOUD)
     
     audio_path, text_path = get_paired_paths(feature)
-    temp_path = get_temp_filepath('upload', 'webm', directory=os.path.dirname(audio_path))
     
-    file.save(temp_path)
-    
-    if convert_to_wav(temp_path, audio_path):
-        _maybe_cleanup([temp_path], force=True)
-    else:
-        os.rename(temp_path, audio_path)
+    if not convert_stream_to_wav(file.stream, audio_path):
+        # Keep the raw upload so the attempt is not lost.
+        file.stream.seek(0)
+        file.save(audio_path)
     
     with open(text_path, 'w', encoding='utf-8') as f:
         f.write(text)
@@ -1734,23 +2122,22 @@ def check():
     feature = request.form.get('feature', FEATURE_READ_ALOUD)
     accent = request.form.get('accent', 'US_MFA')  # Default to US_MFA
     
-    job_id = str(uuid.uuid4())[:8]
+    if not _reserve_job_slot("mfa"):
+        return _job_pool_busy_response()
+    submitted = False
+
+    job_id = new_job_id()
     audio_path, text_path = get_paired_paths(feature)
-    temp_upload = get_temp_filepath(f'upload_{job_id}', 'tmp', directory=os.path.dirname(audio_path))
     
     try:
-        file.save(temp_upload)
-        
-        if not convert_to_wav(temp_upload, audio_path):
-            _maybe_cleanup([temp_upload], force=True)
+        if not convert_stream_to_wav(file.stream, audio_path):
             return jsonify({"error": "Audio conversion failed"}), 500
         
-        _maybe_cleanup([temp_upload], force=True)
-        
         with open(text_path, 'w', encoding='utf-8') as f:
             f.write(text)
         
-        JOB_STORE[job_id] = {
+        _ensure_job_sweeper()
+        JOB_STORE.create(job_id, {
             'status': 'queued',
             'result': None,
             'error': None,
@@ -1758,14 +2145,10 @@ def check():
             'text_path': text_path,
             'accent': accent,
             'created_at': datetime.datetime.now().isoformat()
-        }
+        })
         
-        thread = threading.Thread(
-            target=run_mfa_job,
-            args=(job_id, audio_path, text_path),
-            daemon=True
-        )
-        thread.start()
+        _submit_job("mfa", run_mfa_job, job_id, audio_path, text_path)
+        submitted = True
         
         return jsonify({
             "status": "queued",
@@ -1775,17 +2158,22 @@ def check():
         })
         
     except Exception as e:
+        if not submitted:
+            JOB_STORE.fail(job_id, str(e))  # don't leave a 'queued' record nothing will run
         import traceback
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
+    finally:
+        if not submitted:
+            _job_pool_done("mfa")
 
 @app.route('/check/status/<job_id>', methods=['GET'])
 def check_status(job_id):
     """Get status of a pronunciation check job."""
-    if job_id not in JOB_STORE:
+    job = JOB_STORE.get(job_id)
+    if job is None:
         return jsonify({"error": "Job not found"}), 404
     
-    job = JOB_STORE[job_id]
     response = {"job_id": job_id, "status": job['status']}
     
     if job['status'] == 'complete':
@@ -1793,7 +2181,46 @@ def check_status(job_id):
     elif job['status'] == 'failed':
         response['error'] = job['error']
     
-    return jsonify(response)
+    return fast_jsonify(response)
+
+def _buffered_ndjson(updates, max_bytes=4096, max_delay=0.05):
+    """
+    Serialize updates as NDJSON with fewer, larger writes.
+    A progress event that starts a new stage (a different message) and any
+    non-progress event flush immediately. Progress events that only advance the
+    percent within the current stage are coalesced (only the latest is kept) and
+    written once max_delay has passed since the last flush; there is no timer, so
+    a coalesced tick waits for the next event.
+    """
+    buffered = []
+    pending_progress = None
+    last_flush = 0.0
+    last_stage = None
+    for update in updates:
+        line = _json_dumps(update) + "\n"
+        is_progress = isinstance(update, dict) and update.get("type") == "progress"
+        new_stage = False
+        if is_progress:
+            pending_progress = line
+            stage = update.get("message")
+            new_stage = stage != last_stage
+            last_stage = stage
+        else:
+            if pending_progress:
+                buffered.append(pending_progress)
+                pending_progress = None
+            buffered.append(line)
+
+        now = time.monotonic()
+        size = sum(len(chunk) for chunk in buffered) + len(pending_progress or "")
+        if not is_progress or new_stage or size >= max_bytes or now - last_flush >= max_delay:
+            yield "".join(buffered) + (pending_progress or "")
+            buffered = []
+            pending_progress = None
+            last_flush = now
+
+    if buffered or pending_progress:
+        yield "".join(buffered) + (pending_progress or "")
 
 @app.route('/check_stream', methods=['POST'])
 def check_stream():
@@ -1807,15 +2234,14 @@ def check_stream():
     accent = request.form.get('accent', 'US_MFA')  # Default to US_MFA
     
     audio_path, text_path = get_paired_paths(feature)
-    temp_upload = get_temp_filepath("temp_upload", "tmp", directory=os.path.dirname(audio_path))
-    
-    file.save(temp_upload)
+    # Convert straight from the upload stream while the request (and its
+    # spooled file) is still open; the generator below runs after the view returns.
+    converted = convert_stream_to_wav(file.stream, audio_path)
 
     def generate():
         try:
             yield json.dumps({"type": "progress", "percent": 2, "message": "Converting audio..."}) + "\n"
-            if not convert_to_wav(temp_upload, audio_path):
-                 _maybe_cleanup([temp_upload], force=True)
+            if not converted:
                  yield json.dumps({"type": "error", "message": "Audio conversion failed"}) + "\n"
                  return
             
@@ -1823,18 +2249,21 @@ def check_stream():
                 f.write(text)
                 
             from api.validator import align_and_validate_gen
-            for update in align_and_validate_gen(audio_path, text_path, accents=[accent]):
-                if isinstance(update, dict) and update.get("type") == "result":
-                    _persist_attempt_artifacts(audio_path, update.get("data"), filename="check_stream_result.json")
-                yield json.dumps(update) + "\n"
+
+            def updates():
+                for update in align_and_validate_gen(audio_path, text_path, accents=[accent]):
+                    if isinstance(update, dict) and update.get("type") == "result":
+                        _persist_attempt_artifacts(audio_path, update.get("data"), filename="check_stream_result.json")
+                    yield update
+
+            yield from _buffered_ndjson(updates())
                 
         except Exception as e:
             import traceback
             traceback.print_exc()
             yield json.dumps({"type": "error", "message": str(e)}) + "\n"
         finally:
-            _maybe_cleanup([temp_upload], force=True)
-            _maybe_cleanup([audio_path, text_path])
+            _maybe_cleanup([audio_path, text_path], background=True)
 
     return Response(generate(), mimetype='application/x-ndjson')
 
@@ -1862,7 +2291,7 @@ def get_image_task():
     chart_type_value = infer_chart_type(image_data)
     timing_config = get_describe_image_runtime_config()
 
-    return jsonify({
+    return fast_jsonify({
         "image_id": image_data['id'],
         "image_url": f"/images/{image_data['filename']}",
         "title": image_data['title'],
@@ -1916,18 +2345,19 @@ def submit_description():
         except ValueError:
             recording_seconds = None
     
-    job_id = str(uuid.uuid4())[:8]
+    if not _reserve_job_slot("image"):
+        return _job_pool_busy_response()
+    submitted = False
+
+    job_id = new_job_id()
     audio_path, _ = get_paired_paths(FEATURE_DESCRIBE_IMAGE)
-    temp_upload = get_temp_filepath(f'img_{job_id}', 'tmp', directory=os.path.dirname(audio_path))
     
     try:
-        file.save(temp_upload)
-        if not convert_to_wav(temp_upload, audio_path):
-            _maybe_cleanup([temp_upload], force=True)
+        if not convert_stream_to_wav(file.stream, audio_path):
             return jsonify({"error": "Audio conversion failed"}), 500
-        _maybe_cleanup([temp_upload], force=True)
         
-        IMAGE_JOB_STORE[job_id] = {
+        _ensure_job_sweeper()
+        IMAGE_JOB_STORE.create(job_id, {
             'status': 'queued',
             'result': None,
             'error': None,
@@ -1936,14 +2366,10 @@ def submit_description():
             'accent': accent,
             'recording_seconds': recording_seconds,
             'created_at': datetime.datetime.now().isoformat()
-        }
+        })
         
-        thread = threading.Thread(
-            target=run_image_evaluation_job,
-            args=(job_id, image_id, audio_path),
-            daemon=True
-        )
-        thread.start()
+        _submit_job("image", run_image_evaluation_job, job_id, image_id, audio_path)
+        submitted = True
         
         return jsonify({
             "status": "queued",
@@ -1952,23 +2378,28 @@ def submit_description():
             "message": "Processing started."
         })
     except Exception as e:
+        if not submitted:
+            IMAGE_JOB_STORE.fail(job_id, str(e))
         return jsonify({"error": str(e)}), 500
+    finally:
+        if not submitted:
+            _job_pool_done("image")
 
 @app.route('/describe-image/status/<job_id>', methods=['GET'])
 def description_status(job_id):
-    if job_id not in IMAGE_JOB_STORE:
+    job = IMAGE_JOB_STORE.get(job_id)
+    if job is None:
         return jsonify({"error": "Job not found"}), 404
-    job = IMAGE_JOB_STORE[job_id]
     response = {"job_id": job_id, "status": job['status']}
     if job['status'] == 'complete':
         response['result'] = job['result']
     elif job['status'] == 'failed':
         response['error'] = job['error']
-    return jsonify(response)
+    return fast_jsonify(response)
 
 @app.route('/images/<path:filename>')
 def serve_image(filename):
-    return send_from_directory(IMAGES_DIR, filename)
+    return _send_static_media(IMAGES_DIR, filename, "images")
 
 # ============================================================================
 # ROUTES - RETELL LECTURE
@@ -2019,7 +2450,7 @@ def get_lecture_task():
         if cleaned_points:
             example_response = " ".join(cleaned_points[:3])
 
-    return jsonify({
+    return fast_jsonify({
         "lecture_id": resolved_lecture_id,
         "audio_url": _build_retell_audio_url(resolved_lecture_id, tts_params),
         "title": lecture_data['title'],
@@ -2086,18 +2517,19 @@ def submit_lecture():
         except ValueError:
             recording_seconds = None
     
-    job_id = str(uuid.uuid4())[:8]
+    if not _reserve_job_slot("lecture"):
+        return _job_pool_busy_response()
+    submitted = False
+
+    job_id = new_job_id()
     audio_path, _ = get_paired_paths(FEATURE_RETELL_LECTURE)
-    temp_upload = get_temp_filepath(f'lec_{job_id}', 'tmp', directory=os.path.dirname(audio_path))
     
     try:
-        file.save(temp_upload)
-        if not convert_to_wav(temp_upload, audio_path):
-            _maybe_cleanup([temp_upload], force=True)
+        if not convert_stream_to_wav(file.stream, audio_path):
             return jsonify({"error": "Audio conversion failed"}), 500
-        _maybe_cleanup([temp_upload], force=True)
         
-        LECTURE_JOB_STORE[job_id] = {
+        _ensure_job_sweeper()
+        LECTURE_JOB_STORE.create(job_id, {
             'status': 'queued',
             'result': None,
             'error': None,
@@ -2106,14 +2538,10 @@ def submit_lecture():
             'accent': accent,
             'recording_seconds': recording_seconds,
             'created_at': datetime.datetime.now().isoformat()
-        }
+        })
         
-        thread = threading.Thread(
-            target=run_lecture_evaluation_job,
-            args=(job_id, lecture_id, audio_path),
-            daemon=True
-        )
-        thread.start()
+        _submit_job("lecture", run_lecture_evaluation_job, job_id, lecture_id, audio_path)
+        submitted = True
         
         return jsonify({
             "status": "queued",
@@ -2122,23 +2550,29 @@ def submit_lecture():
             "message": "Processing started."
         })
     except Exception as e:
+        if not submitted:
+            LECTURE_JOB_STORE.fail(job_id, str(e))
         return jsonify({"error": str(e)}), 500
+    finally:
+        if not submitted:
+            _job_pool_done("lecture")
 
 @app.route('/retell-lecture/status/<job_id>', methods=['GET'])
 def lecture_status(job_id):
-    if job_id not in LECTURE_JOB_STORE:
+    job = LECTURE_JOB_STORE.get(job_id)
+    if job is None:
         return jsonify({"error": "Job not found"}), 404
-    job = LECTURE_JOB_STORE[job_id]
     response = {"job_id": job_id, "status": job['status']}
     if job['status'] == 'complete':
         response['result'] = job['result']
     elif job['status'] == 'failed':
         response['error'] = job['error']
-    return jsonify(response)
+    return fast_jsonify(response)
 
 if __name__ == '__main__':
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--debug", action="store_true", help="Run the Werkzeug dev server with debug/reload.")
     args = parser.parse_args()
-    app.run(debug=True, host='0.0.0.0', port=args.port)
+    app.run(debug=args.debug, host='0.0.0.0', port=args.port, threaded=True)
@@ -4,8 +4,8 @@ Handles standardized file naming and path generation for user-uploaded audio fil
 """
 
 import os
-import datetime
-import uuid
+import itertools
+import time
 import re
 from pathlib import Path
 
@@ -32,9 +32,25 @@ def _normalize_feature_name(feature_name: str) -> str:
     return normalized or "attempt"
 
 
+# Attempt names only carry second resolution, so format each second once and
+# make names unique with the pid and a counter instead of a uuid4 draw.
+_ATTEMPT_COUNTER = itertools.count()
+_timestamp_cache = (None, "")
+
+
+def _attempt_timestamp() -> str:
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if cached_second != now:
+        formatted = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+
 def _generate_attempt_name(feature_name: str) -> str:
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    short_id = str(uuid.uuid4())[:6]
+    timestamp = _attempt_timestamp()
+    short_id = f"{os.getpid() & 0xFFF:03x}{next(_ATTEMPT_COUNTER) & 0xFFF:03x}"
     feature_slug = _normalize_feature_name(feature_name)
     return f"{feature_slug}_{timestamp}_{short_id}"
 
@@ -107,7 +123,7 @@ def get_temp_filepath(prefix: str = 'temp', extension: str = 'tmp', directory: s
         extension: File extension (default: tmp)
     
     Returns:
-        Absolute path: /path/to/data/user_uploads/{attempt}/{prefix}_{uuid}.{ext}
+        Absolute path: /path/to/data/user_uploads/{attempt}/{prefix}_{id}.{ext}
     
     Example:
         >>> get_temp_filepath('upload')
@@ -115,7 +131,7 @@ def get_temp_filepath(prefix: str = 'temp', extension: str = 'tmp', directory: s
     """
     parent_dir = Path(directory) if directory else CORPUS_DIR
     parent_dir.mkdir(parents=True, exist_ok=True)
-    unique_id = str(uuid.uuid4())[:8]
+    unique_id = f"{os.getpid() & 0xFFFF:04x}{next(_ATTEMPT_COUNTER) & 0xFFFF:04x}"
     filename = f"{prefix}_{unique_id}.{extension}"
     return str(parent_dir / filename)
 
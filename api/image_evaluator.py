@@ -4,31 +4,50 @@ Handles evaluation of student image descriptions against reference descriptions.
 Uses Sentence Transformers for semantic matching and Regex for structure analysis.
 """
 
+import copy
+import functools
+import hashlib
+import importlib.util
 import json
 import random
 import re
 import os
 import threading
-from typing import Dict, List, Tuple, Optional
-
-# Try to import sentence_transformers for semantic matching
-try:
-    from sentence_transformers import SentenceTransformer, util
-    TRANSFORMER_AVAILABLE = True
-except ImportError:
-    TRANSFORMER_AVAILABLE = False
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# sentence_transformers pulls in torch, so only probe for it here and import it
+# on first use (see _import_sentence_transformers).
+TRANSFORMER_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+if not TRANSFORMER_AVAILABLE:
     print("Warning: sentence-transformers not available, semantic scoring will be disabled")
+SentenceTransformer = None
+util = None
 
+from api.text_scoring import evaluate_batch
 from src.shared.paths import IMAGE_REFERENCE_FILE
 
 # Global model cache
 SEMANTIC_MODEL = None
 MODEL_NAME = 'all-MiniLM-L6-v2'
 
+def _import_sentence_transformers() -> bool:
+    """Import sentence_transformers on first use; returns availability."""
+    global SentenceTransformer, util, TRANSFORMER_AVAILABLE
+    if TRANSFORMER_AVAILABLE and SentenceTransformer is None:
+        try:
+            from sentence_transformers import SentenceTransformer as _SentenceTransformer, util as _util
+            SentenceTransformer, util = _SentenceTransformer, _util
+        except Exception as e:
+            TRANSFORMER_AVAILABLE = False
+            print(f"Warning: sentence-transformers import failed, semantic scoring will be disabled: {e}")
+    return TRANSFORMER_AVAILABLE
+
+
 def _eager_load_model():
     """Pre-load model into process memory."""
     global SEMANTIC_MODEL
-    if TRANSFORMER_AVAILABLE and SEMANTIC_MODEL is None:
+    if SEMANTIC_MODEL is None and _import_sentence_transformers():
         try:
             print(f"[image_evaluator] Pre-loading SentenceTransformer: {MODEL_NAME}...")
             SEMANTIC_MODEL = SentenceTransformer(MODEL_NAME)
@@ -64,7 +83,6 @@ HARD_TEMPLATE_PATTERNS = {
     r"\bi am done\b",
 }
 
-
 def _safe_int_env(name: str, default: int, minimum: int) -> int:
     raw_value = os.getenv(name, str(default)).strip()
     try:
@@ -89,13 +107,33 @@ def get_describe_image_runtime_config() -> Dict[str, int]:
     }
 
 
+@functools.lru_cache(maxsize=4)
+def _load_image_data_cached(path: str, mtime_ns: int) -> Tuple[Dict, Dict, Dict]:
+    """Parse the reference file once per mtime, index images by id and lowercase their keywords."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    index = {}
+    keywords_lower = {}
+    for img in data.get("images", []):
+        if isinstance(img, dict) and img.get("id") not in index:
+            index[img.get("id")] = img
+            keywords = img.get("keywords", [])
+            if isinstance(keywords, list):
+                keywords_lower[img.get("id")] = tuple(str(kw).lower() for kw in keywords)
+    return data, index, keywords_lower
+
+
+def _image_data_and_index() -> Tuple[Dict, Dict, Dict]:
+    try:
+        mtime_ns = REFERENCES_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {"images": []}, {}, {}
+    return _load_image_data_cached(str(REFERENCES_FILE), mtime_ns)
+
+
 def load_image_data() -> Dict:
-    """Load image reference data from JSON file."""
-    if not REFERENCES_FILE.exists():
-        return {"images": []}
-    
-    with open(REFERENCES_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load image reference data from JSON file (cached until the file changes; treat as read-only)."""
+    return _image_data_and_index()[0]
 
 
 def get_image_topics() -> List[str]:
@@ -207,14 +245,7 @@ def get_random_image(
 
 def get_image_by_id(image_id: str) -> Optional[Dict]:
     """Get specific image by ID."""
-    data = load_image_data()
-    images = data.get("images", [])
-    
-    for img in images:
-        if img.get("id") == image_id:
-            return img
-    
-    return None
+    return _image_data_and_index()[1].get(image_id)
 
 
 def get_semantic_model():
@@ -225,29 +256,34 @@ def get_semantic_model():
     return SEMANTIC_MODEL
 
 
-def preprocess_text(text: str) -> str:
-    """Clean and normalize text for comparison."""
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove punctuation (keep alphanumeric and spaces)
-    text = re.sub(r'[^a-z0-9\s]', '', text)
-    
-    return text
+def find_missing_keywords(keywords: List[str], student_text: str) -> List[str]:
+    """Keywords (in rubric order) that do not appear in the student text."""
+    return _missing_keywords_in_lower(keywords, student_text.lower())
 
 
-def calculate_keyword_coverage(keywords: List[str], student_text: str) -> float:
+def _missing_keywords_in_lower(
+    keywords: List[str],
+    student_text_lower: str,
+    keywords_lower: Optional[Sequence[str]] = None,
+) -> List[str]:
+    if keywords_lower is None or len(keywords_lower) != len(keywords):
+        return [kw for kw in keywords if kw.lower() not in student_text_lower]
+    return [kw for kw, kw_lower in zip(keywords, keywords_lower) if kw_lower not in student_text_lower]
+
+
+def calculate_keyword_coverage(
+    keywords: List[str],
+    student_text: str,
+    missing_keywords: Optional[List[str]] = None,
+) -> float:
     """Calculate what percentage of keywords appear in student text."""
     if not keywords:
         return 1.0
-    
-    student_text_lower = student_text.lower()
-    matched = sum(1 for kw in keywords if kw.lower() in student_text_lower)
-    
-    return matched / len(keywords)
+
+    if missing_keywords is None:
+        missing_keywords = find_missing_keywords(keywords, student_text)
+
+    return (len(keywords) - len(missing_keywords)) / len(keywords)
 
 
 def calculate_semantic_similarity(reference: str, student_text: str) -> float:
@@ -277,7 +313,10 @@ def check_structure(text: str) -> Dict[str, bool]:
     Check for structural elements using Regex.
     Returns dict: {'has_intro': bool, 'has_conclusion': bool, 'has_trends': bool}
     """
-    text_lower = text.lower().strip()
+    return _structure_from_lower(text.lower().strip())
+
+
+def _structure_from_lower(text_lower: str) -> Dict[str, bool]:
     if not text_lower:
         return {'has_intro': False, 'has_conclusion': False, 'has_trends': False}
 
@@ -345,7 +384,10 @@ def detect_memorized_template(student_text: str) -> Dict[str, object]:
 
     We only use this as a gating signal when content relevance is also weak.
     """
-    text_lower = str(student_text or "").lower()
+    return _template_evidence_from_lower(str(student_text or "").lower())
+
+
+def _template_evidence_from_lower(text_lower: str) -> Dict[str, object]:
     matched_patterns = []
     hard_hit = False
 
@@ -411,6 +453,7 @@ def calculate_score(
     keywords: List[str],
     mfa_words: Optional[List[Dict]] = None,
     speech_duration_seconds: Optional[float] = None,
+    keywords_lower: Optional[Sequence[str]] = None,
 ) -> Tuple[int, Dict]:
     """
     Calculate PTE-style score (0-90) for image description — Hybrid engine.
@@ -427,6 +470,8 @@ def calculate_score(
     """
     timing_cfg = get_describe_image_runtime_config()
     text = (student_text or "").strip()
+    # Lowercase once; keyword, structure and template checks all work on it.
+    text_lower = text.lower()
     word_count = len(text.split())
 
     if not text or len(text) < 10:
@@ -443,9 +488,10 @@ def calculate_score(
         }
 
     semantic_sim = max(0.0, calculate_semantic_similarity(reference, text))
-    keyword_cov = calculate_keyword_coverage(keywords, text)
+    missing_keywords = _missing_keywords_in_lower(keywords, text_lower, keywords_lower)
+    keyword_cov = calculate_keyword_coverage(keywords, text, missing_keywords)
     number_cov = calculate_number_coverage(reference, text)
-    template_evidence = detect_memorized_template(text)
+    template_evidence = _template_evidence_from_lower(text_lower)
     duration_seconds = infer_speaking_duration(mfa_words, speech_duration_seconds)
 
     content_gate = {"active": False, "code": None, "reason": ""}
@@ -478,7 +524,7 @@ def calculate_score(
             "semantic_similarity": round(semantic_sim * 100, 1),
             "keyword_coverage": round(keyword_cov * 100, 1),
             "number_coverage": round(number_cov * 100, 1),
-            "structure_metrics": check_structure(text),
+            "structure_metrics": _structure_from_lower(text_lower),
             "word_count": word_count,
             "content_gate": content_gate,
             "template_evidence": template_evidence,
@@ -500,7 +546,7 @@ def calculate_score(
     pronun_score_90, pronun_raw = compute_pronunciation_score(mfa_words or [])
     pronun_pts = pronun_raw * 27
 
-    structure = check_structure(text)
+    structure = _structure_from_lower(text_lower)
     structure_pts = 0.0
     if structure['has_intro']:
         structure_pts += 3.0
@@ -550,6 +596,7 @@ def calculate_score(
         "number_score": round(number_pts, 1),
         "semantic_similarity": round(semantic_sim * 100, 1),
         "keyword_coverage": round(keyword_cov * 100, 1),
+        "missing_keywords": missing_keywords[:3],
         "number_coverage": round(number_cov * 100, 1),
         "structure_metrics": structure,
         "word_count": word_count,
@@ -601,7 +648,9 @@ def generate_feedback(score: int, details: Dict, keywords: List[str], student_te
     # Keyword Feedback
     keyword_cov = details.get("keyword_coverage", 0)
     if keyword_cov < 50:
-        missing = [k for k in keywords if k.lower() not in student_text.lower()][:3]
+        missing = details.get("missing_keywords")
+        if missing is None:
+            missing = find_missing_keywords(keywords, student_text)[:3]
         if missing:
             feedback_parts.append(f"Try to use key words: {', '.join(missing)}.")
 
@@ -624,6 +673,49 @@ def generate_feedback(score: int, details: Dict, keywords: List[str], student_te
     return " ".join(feedback_parts)
 
 
+# Finished evaluations keyed by everything that feeds calculate_score, so a
+# re-submitted transcript (retries, replays) skips scoring entirely.
+EVALUATION_CACHE_MAX = 512
+_EVALUATION_CACHE = OrderedDict()
+_EVALUATION_CACHE_LOCK = threading.Lock()
+
+
+def _evaluation_cache_key(
+    image_id: str,
+    reference: str,
+    keywords: List[str],
+    student_text: str,
+    mfa_words: Optional[List[Dict]],
+    speech_duration_seconds: Optional[float],
+) -> str:
+    payload = json.dumps(
+        [
+            image_id, reference, keywords, student_text, mfa_words, speech_duration_seconds,
+            SEMANTIC_MODEL is not None, get_describe_image_runtime_config(),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _evaluation_cache_get(cache_key: str) -> Optional[Dict]:
+    with _EVALUATION_CACHE_LOCK:
+        cached = _EVALUATION_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        _EVALUATION_CACHE.move_to_end(cache_key)
+        return copy.deepcopy(cached)
+
+
+def _evaluation_cache_put(cache_key: str, result: Dict) -> None:
+    with _EVALUATION_CACHE_LOCK:
+        _EVALUATION_CACHE[cache_key] = copy.deepcopy(result)
+        _EVALUATION_CACHE.move_to_end(cache_key)
+        while len(_EVALUATION_CACHE) > EVALUATION_CACHE_MAX:
+            _EVALUATION_CACHE.popitem(last=False)
+
+
 def evaluate_description(
     image_id: str,
     student_text: str,
@@ -640,13 +732,19 @@ def evaluate_description(
                       When provided, pronunciation score is computed from them.
         speech_duration_seconds: Optional client-side measured recording length.
     """
-    image_data = get_image_by_id(image_id)
+    _, index, keywords_lower_by_id = _image_data_and_index()
+    image_data = index.get(image_id)
     if not image_data:
         return {"error": "Image not found", "score": 0}
 
     reference = image_data.get("reference", "")
     keywords  = image_data.get("keywords", [])
 
+    cache_key = _evaluation_cache_key(image_id, reference, keywords, student_text, mfa_words, speech_duration_seconds)
+    cached = _evaluation_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     # Calculate score (passes MFA words for pronunciation scoring)
     score, details = calculate_score(
         reference,
@@ -654,12 +752,13 @@ def evaluate_description(
         keywords,
         mfa_words=mfa_words,
         speech_duration_seconds=speech_duration_seconds,
+        keywords_lower=keywords_lower_by_id.get(image_id),
     )
 
     # Generate feedback
     feedback = generate_feedback(score, details, keywords, student_text)
 
-    return {
+    result = {
         "score": score,
         "feedback": feedback,
         "details": details,
@@ -668,6 +767,21 @@ def evaluate_description(
         "reference": reference,
         "keywords": keywords,
     }
+    _evaluation_cache_put(cache_key, result)
+    return result
+
+
+def _evaluate_description_item(item: Sequence) -> Dict:
+    return evaluate_description(*item)
+
+
+def evaluate_descriptions_batch(
+    items: Iterable[Sequence],
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+) -> List[Dict]:
+    """Score many (image_id, student_text[, mfa_words, speech_duration_seconds]) items in input order."""
+    return evaluate_batch(_evaluate_description_item, items, max_workers=max_workers, use_processes=use_processes)
 
 
 if __name__ == "__main__":
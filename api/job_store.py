@@ -0,0 +1,126 @@
+"""
+In-memory store for async job records (Read Aloud checks, image and lecture evaluations).
+
+Records are spread over independently locked shards so request threads polling
+status and pool workers writing results rarely contend on the same lock, and
+every status transition (e.g. status + result) is applied under one lock so
+readers never observe a half-written record. Finished records are stamped with
+finished_at so a periodic sweep() can drop them once clients stop polling.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+FINISHED_STATUSES = ("complete", "failed")
+
+_JOB_COUNTER = itertools.count(1)
+
+
+def new_job_id() -> str:
+    """
+    Short unique job id without an entropy draw: millisecond clock + process counter.
+    The clock prefix keeps ids from repeating across restarts; next() on
+    itertools.count is atomic under the GIL, so no lock is needed.
+    """
+    return f"{int(time.time() * 1000) & 0xFFFFFFFF:08x}{next(_JOB_COUNTER) & 0xFFFF:04x}"
+
+
+class ShardedJobStore:
+    """Thread-safe job records keyed by job_id, bounded per shard."""
+
+    def __init__(self, shards: int = 16, max_entries: int = 1024):
+        # Round up to a power of two so shard selection is a mask.
+        shard_count = 1
+        while shard_count < max(1, shards):
+            shard_count <<= 1
+        self._mask = shard_count - 1
+        self._shards = [(OrderedDict(), threading.Lock()) for _ in range(shard_count)]
+        self.max_entries = max(1, max_entries)
+
+    def _shard(self, job_id):
+        return self._shards[hash(job_id) & self._mask]
+
+    def _shard_limit(self) -> int:
+        return max(1, -(-self.max_entries // len(self._shards)))
+
+    def create(self, job_id, record: Dict) -> None:
+        """Insert a record, evicting the oldest finished jobs once the shard is full."""
+        records, lock = self._shard(job_id)
+        with lock:
+            records[job_id] = dict(record)
+            overflow = len(records) - self._shard_limit()
+            if overflow <= 0:
+                return
+            finished = [
+                key for key, job in records.items()
+                if key != job_id and job.get("status") in FINISHED_STATUSES
+            ]
+            for key in finished[:overflow]:
+                records.pop(key, None)
+
+    def get(self, job_id) -> Optional[Dict]:
+        """Return a snapshot of the record, or None if unknown/evicted."""
+        records, lock = self._shard(job_id)
+        with lock:
+            job = records.get(job_id)
+            return dict(job) if job is not None else None
+
+    def update(self, job_id, **fields) -> bool:
+        records, lock = self._shard(job_id)
+        with lock:
+            job = records.get(job_id)
+            if job is None:
+                return False
+            job.update(fields)
+            return True
+
+    def set_status(self, job_id, status: str) -> bool:
+        return self.update(job_id, status=status)
+
+    def _finish(self, job_id, **fields) -> bool:
+        records, lock = self._shard(job_id)
+        with lock:
+            job = records.get(job_id)
+            if job is None:
+                return False
+            job.update(fields, finished_at=time.time())
+            # Keep finished records in completion order so eviction drops the stalest first.
+            records.move_to_end(job_id)
+            return True
+
+    def complete(self, job_id, result) -> bool:
+        return self._finish(job_id, status="complete", result=result)
+
+    def fail(self, job_id, error: str) -> bool:
+        return self._finish(job_id, status="failed", error=error)
+
+    def sweep(self, max_age: float, now: Optional[float] = None) -> int:
+        """Drop finished records older than max_age seconds; returns how many were removed."""
+        cutoff = (time.time() if now is None else now) - max_age
+        removed = 0
+        for records, lock in self._shards:
+            with lock:
+                expired = [
+                    key for key, job in records.items()
+                    if job.get("status") in FINISHED_STATUSES
+                    and job.get("finished_at", cutoff) < cutoff
+                ]
+                for key in expired:
+                    del records[key]
+                removed += len(expired)
+        return removed
+
+    def __contains__(self, job_id) -> bool:
+        records, lock = self._shard(job_id)
+        with lock:
+            return job_id in records
+
+    def __len__(self) -> int:
+        total = 0
+        for records, lock in self._shards:
+            with lock:
+                total += len(records)
+        return total
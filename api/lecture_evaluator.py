@@ -10,32 +10,23 @@ The implementation is practice-oriented and transparent; Pearson's full
 production algorithm is proprietary.
 """
 
+import functools
+import importlib.util
 import json
 import os
 import random
 import re
-from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from src.shared.paths import LECTURE_REFERENCE_FILE
 
-# Fallback lexical similarity.
-try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-
-    SKLEARN_AVAILABLE = True
-except Exception:
-    SKLEARN_AVAILABLE = False
-
 # Reuse speaking-semantic model and MFA pronunciation aggregation.
 from api.image_evaluator import get_semantic_model, compute_pronunciation_score
+from api.text_scoring import evaluate_batch, preprocess_text, tfidf_term_counts, two_document_tfidf_cosine
 
-try:
-    from sentence_transformers import util as st_util
-
-    SENTENCE_UTIL_AVAILABLE = True
-except Exception:
-    SENTENCE_UTIL_AVAILABLE = False
+# Resolved lazily alongside the semantic model to keep torch out of import time.
+SENTENCE_UTIL_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
 
 REFERENCES_FILE = LECTURE_REFERENCE_FILE
 DIFFICULTY_ORDER = {"easy": 0, "medium": 1, "difficult": 2}
@@ -123,20 +114,37 @@ def _normalize_difficulty(value: Optional[str], fallback: str = "medium") -> str
     return fallback
 
 
-def load_lecture_data() -> Dict:
-    """Load retell-lecture references."""
-    if not REFERENCES_FILE.exists():
-        return {"lectures": []}
+@functools.lru_cache(maxsize=4)
+def _load_lecture_data_cached(path: str, mtime_ns: int) -> Tuple[Dict, Dict, Dict]:
+    """Parse the reference file once per mtime, index lectures by id and lowercase their keywords."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    index = {}
+    keywords_lower = {}
+    for lecture in data.get("lectures", []):
+        if not isinstance(lecture, dict):
+            continue
+        lecture_id = str(lecture.get("id", "")).strip()
+        if lecture_id in index:
+            continue
+        index[lecture_id] = lecture
+        keywords = lecture.get("keywords", [])
+        if isinstance(keywords, list):
+            keywords_lower[lecture_id] = tuple(str(kw).lower() for kw in keywords)
+    return data, index, keywords_lower
 
-    with open(REFERENCES_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+
+def _lecture_data_and_index() -> Tuple[Dict, Dict, Dict]:
+    try:
+        mtime_ns = REFERENCES_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {"lectures": []}, {}, {}
+    return _load_lecture_data_cached(str(REFERENCES_FILE), mtime_ns)
 
 
-def preprocess_text(text: str) -> str:
-    text = str(text or "").lower()
-    text = re.sub(r"\s+", " ", text).strip()
-    text = re.sub(r"[^a-z0-9\s]", "", text)
-    return text
+def load_lecture_data() -> Dict:
+    """Load retell-lecture references (cached until the file changes; treat as read-only)."""
+    return _lecture_data_and_index()[0]
 
 
 def _tokenize_words(text: str) -> List[str]:
@@ -286,20 +294,22 @@ def get_random_lecture(difficulty: Optional[str] = None) -> Optional[Dict]:
 
 
 def get_lecture_by_id(lecture_id: str) -> Optional[Dict]:
-    data = load_lecture_data()
-    lectures = data.get("lectures", [])
-    needle = str(lecture_id or "").strip()
-    for lecture in lectures:
-        if str(lecture.get("id", "")).strip() == needle:
-            return lecture
-    return None
+    return _lecture_data_and_index()[1].get(str(lecture_id or "").strip())
 
 
-def calculate_keyword_coverage(keywords: List[str], student_text: str) -> float:
+def calculate_keyword_coverage(
+    keywords: List[str],
+    student_text: str,
+    text_lower: Optional[str] = None,
+    keywords_lower: Optional[Sequence[str]] = None,
+) -> float:
     if not keywords:
         return 1.0
-    text_lower = str(student_text or "").lower()
-    matched = sum(1 for kw in keywords if str(kw).lower() in text_lower)
+    if text_lower is None:
+        text_lower = str(student_text or "").lower()
+    if keywords_lower is None or len(keywords_lower) != len(keywords):
+        keywords_lower = [str(kw).lower() for kw in keywords]
+    matched = sum(1 for kw in keywords_lower if kw in text_lower)
     return matched / len(keywords)
 
 
@@ -311,17 +321,22 @@ def _token_overlap_ratio(reference: str, student_text: str) -> float:
     return len(reference_tokens & student_tokens) / len(reference_tokens)
 
 
-def tfidf_similarity(reference: str, student_text: str) -> float:
-    if not SKLEARN_AVAILABLE:
-        return _token_overlap_ratio(reference, student_text)
+@functools.lru_cache(maxsize=256)
+def _reference_term_counts(reference: str) -> Counter:
+    return tfidf_term_counts(reference)
 
-    vectorizer = TfidfVectorizer()
-    try:
-        matrix = vectorizer.fit_transform([reference, student_text])
-        similarity = cosine_similarity(matrix[0:1], matrix[1:2])[0][0]
-        return float(similarity)
-    except Exception:
+
+def tfidf_similarity(reference: str, student_text: str) -> float:
+    """
+    Cosine similarity of the reference and response under TF-IDF fitted on just
+    those two documents (see api.text_scoring); the reference's counts are cached
+    across evaluations.
+    """
+    reference_counts = _reference_term_counts(reference)
+    student_counts = tfidf_term_counts(student_text)
+    if not reference_counts and not student_counts:
         return _token_overlap_ratio(reference, student_text)
+    return two_document_tfidf_cosine(reference_counts, student_counts)
 
 
 def semantic_similarity(reference: str, student_text: str) -> float:
@@ -330,6 +345,8 @@ def semantic_similarity(reference: str, student_text: str) -> float:
         return tfidf_similarity(reference, student_text)
 
     try:
+        from sentence_transformers import util as st_util
+
         embeddings = model.encode([reference, student_text], convert_to_tensor=True)
         score = st_util.pytorch_cos_sim(embeddings[0], embeddings[1])
         return float(score.item())
@@ -337,11 +354,10 @@ def semantic_similarity(reference: str, student_text: str) -> float:
         return tfidf_similarity(reference, student_text)
 
 
-def _keyword_overlap_for_point(point: str, student_text: str) -> float:
+def _keyword_overlap_for_point(point: str, student_tokens: set) -> float:
     point_tokens = set(_tokenize_words(point))
     if not point_tokens:
         return 0.0
-    student_tokens = set(_tokenize_words(student_text))
     if not student_tokens:
         return 0.0
     return len(point_tokens & student_tokens) / len(point_tokens)
@@ -350,25 +366,31 @@ def _keyword_overlap_for_point(point: str, student_text: str) -> float:
 def calculate_key_point_coverage(
     key_points: List[str],
     student_text: str,
+    student_tokens: Optional[List[str]] = None,
 ) -> Tuple[float, List[str], List[str], float]:
     cleaned_points = [str(item).strip() for item in key_points if str(item).strip()]
     if not cleaned_points:
         return 1.0, [], [], 1.0
 
+    # Tokenize the response once for every key point's lexical fallback.
+    student_token_set = set(student_tokens if student_tokens is not None else _tokenize_words(student_text))
+
     model = get_semantic_model()
     similarities: List[float] = []
 
     if model is not None and SENTENCE_UTIL_AVAILABLE:
         try:
+            from sentence_transformers import util as st_util
+
             embeddings = model.encode(cleaned_points + [student_text], convert_to_tensor=True)
             student_embedding = embeddings[-1]
             for idx in range(len(cleaned_points)):
                 sim = st_util.pytorch_cos_sim(embeddings[idx], student_embedding)
                 similarities.append(float(sim.item()))
         except Exception:
-            similarities = [_keyword_overlap_for_point(point, student_text) for point in cleaned_points]
+            similarities = [_keyword_overlap_for_point(point, student_token_set) for point in cleaned_points]
     else:
-        similarities = [_keyword_overlap_for_point(point, student_text) for point in cleaned_points]
+        similarities = [_keyword_overlap_for_point(point, student_token_set) for point in cleaned_points]
 
     matched_points: List[str] = []
     missing_points: List[str] = []
@@ -383,8 +405,9 @@ def calculate_key_point_coverage(
     return coverage, matched_points, missing_points, avg_similarity
 
 
-def detect_memorized_template(student_text: str) -> Dict[str, object]:
-    text_lower = str(student_text or "").lower()
+def detect_memorized_template(student_text: str, text_lower: Optional[str] = None) -> Dict[str, object]:
+    if text_lower is None:
+        text_lower = str(student_text or "").lower()
     matched: List[str] = []
     hard_hit = False
 
@@ -428,8 +451,9 @@ def infer_speaking_duration(
     return None
 
 
-def _structure_metrics(student_text: str) -> Dict[str, object]:
-    text_lower = str(student_text or "").lower()
+def _structure_metrics(student_text: str, text_lower: Optional[str] = None) -> Dict[str, object]:
+    if text_lower is None:
+        text_lower = str(student_text or "").lower()
     has_context = bool(re.search(r"\b(lecture|talk|speaker|presentation)\b", text_lower))
     connectors = CONNECTOR_PATTERN.findall(text_lower)
     has_summary = bool(re.search(r"\b(overall|in summary|in conclusion|to conclude)\b", text_lower))
@@ -441,8 +465,9 @@ def _structure_metrics(student_text: str) -> Dict[str, object]:
     }
 
 
-def _filler_ratio(student_text: str) -> float:
-    words = _tokenize_words(student_text)
+def _filler_ratio(student_text: str, words: Optional[List[str]] = None) -> float:
+    if words is None:
+        words = _tokenize_words(student_text)
     if not words:
         return 0.0
     filler_count = sum(1 for token in words if token in FILLER_TOKENS)
@@ -456,6 +481,7 @@ def calculate_score(
     key_points: List[str],
     mfa_words: Optional[List[Dict]] = None,
     speech_duration_seconds: Optional[float] = None,
+    keywords_lower: Optional[Sequence[str]] = None,
 ) -> Tuple[int, Dict]:
     """
     Calculate retell-lecture score on 0-90.
@@ -467,7 +493,10 @@ def calculate_score(
     """
     runtime = get_retell_lecture_runtime_config()
     text = str(student_text or "").strip()
-    word_count = len(_tokenize_words(text))
+    # Lowercase and tokenize once; the content and fluency checks below reuse both.
+    text_lower = text.lower()
+    tokens = _tokenize_words(text_lower)
+    word_count = len(tokens)
 
     if not text or word_count < 5:
         return 0, {
@@ -483,9 +512,11 @@ def calculate_score(
         }
 
     semantic_sim = max(0.0, semantic_similarity(reference, text))
-    keyword_cov = calculate_keyword_coverage(keywords, text)
-    key_point_cov, matched_points, missing_points, key_point_sim_avg = calculate_key_point_coverage(key_points, text)
-    template = detect_memorized_template(text)
+    keyword_cov = calculate_keyword_coverage(keywords, text, text_lower, keywords_lower)
+    key_point_cov, matched_points, missing_points, key_point_sim_avg = calculate_key_point_coverage(
+        key_points, text, student_tokens=tokens
+    )
+    template = detect_memorized_template(text, text_lower)
     duration_seconds = infer_speaking_duration(mfa_words, speech_duration_seconds)
 
     content_gate = {"active": False, "code": None, "reason": ""}
@@ -537,7 +568,7 @@ def calculate_score(
     pronun_pts = pronun_raw * 24
 
     # Fluency: 24 points.
-    structure = _structure_metrics(text)
+    structure = _structure_metrics(text, text_lower)
     structure_pts = 0.0
     if structure["has_context"]:
         structure_pts += 2.5
@@ -580,7 +611,7 @@ def calculate_score(
         else:
             pace_pts = max(1.0, (120.0 / word_count) * 6.0)
 
-    filler_ratio = _filler_ratio(text)
+    filler_ratio = _filler_ratio(text, tokens)
     filler_penalty = 0.0
     if filler_ratio > 0.06:
         filler_penalty = 2.0
@@ -675,7 +706,9 @@ def evaluate_lecture(
     mfa_words: Optional[List[Dict]] = None,
     speech_duration_seconds: Optional[float] = None,
 ) -> Dict:
-    lecture_data = get_lecture_by_id(lecture_id)
+    lecture_key = str(lecture_id or "").strip()
+    _, index, keywords_lower_by_id = _lecture_data_and_index()
+    lecture_data = index.get(lecture_key)
     if not lecture_data:
         return {"error": "Lecture not found", "score": 0}
 
@@ -690,6 +723,7 @@ def evaluate_lecture(
         key_points,
         mfa_words=mfa_words,
         speech_duration_seconds=speech_duration_seconds,
+        keywords_lower=keywords_lower_by_id.get(lecture_key),
     )
 
     return {
@@ -707,6 +741,19 @@ def evaluate_lecture(
     }
 
 
+def _evaluate_lecture_item(item: Sequence) -> Dict:
+    return evaluate_lecture(*item)
+
+
+def evaluate_lectures_batch(
+    items: Iterable[Sequence],
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+) -> List[Dict]:
+    """Score many (lecture_id, student_text[, mfa_words, speech_duration_seconds]) items in input order."""
+    return evaluate_batch(_evaluate_lecture_item, items, max_workers=max_workers, use_processes=use_processes)
+
+
 if __name__ == "__main__":
     sample = get_random_lecture()
     if sample:
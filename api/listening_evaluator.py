@@ -8,6 +8,7 @@ Implements deterministic, rubric-inspired scoring for:
 
 from __future__ import annotations
 
+import functools
 import json
 import random
 import re
@@ -15,8 +16,7 @@ from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import requests
-
+from api.text_scoring import tfidf_term_counts, two_document_tfidf_cosine
 from src.shared.paths import (
     FIB_LISTENING_REFERENCE_FILE,
     MCM_LISTENING_REFERENCE_FILE,
@@ -24,14 +24,14 @@ from src.shared.paths import (
     SMW_LISTENING_REFERENCE_FILE,
     SST_LISTENING_REFERENCE_FILE,
 )
-from src.shared.services import GRAMMAR_SERVICE_URL
+from src.shared.services import GRAMMAR_SERVICE_URL, get_service_session
 
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 
     SKLEARN_AVAILABLE = True
 except Exception:
+    ENGLISH_STOP_WORDS = frozenset()
     SKLEARN_AVAILABLE = False
 
 
@@ -208,7 +208,7 @@ def _fetch_grammar_matches(text: str, timeout: float = 6.0) -> Dict:
         return payload
 
     try:
-        response = requests.post(GRAMMAR_SERVICE_URL, json={"text": clean_text}, timeout=timeout)
+        response = get_service_session().post(GRAMMAR_SERVICE_URL, json={"text": clean_text}, timeout=timeout)
         if response.status_code != 200:
             return payload
         data = response.json()
@@ -285,6 +285,11 @@ def _grammar_signals(text: str) -> Dict:
     return fallback
 
 
+@functools.lru_cache(maxsize=256)
+def _sst_reference_term_counts(reference_text: str) -> Counter:
+    return tfidf_term_counts(reference_text, ENGLISH_STOP_WORDS)
+
+
 def _sst_similarity(reference_text: str, response_text: str) -> float:
     reference_text = _normalize_spaces(reference_text)
     response_text = _normalize_spaces(response_text)
@@ -292,12 +297,10 @@ def _sst_similarity(reference_text: str, response_text: str) -> float:
         return 0.0
 
     if SKLEARN_AVAILABLE:
-        try:
-            vectorizer = TfidfVectorizer(stop_words="english")
-            tfidf = vectorizer.fit_transform([reference_text, response_text])
-            return float(cosine_similarity(tfidf[0:1], tfidf[1:2])[0][0])
-        except Exception:
-            pass
+        reference_counts = _sst_reference_term_counts(reference_text)
+        response_counts = tfidf_term_counts(response_text, ENGLISH_STOP_WORDS)
+        if reference_counts or response_counts:
+            return two_document_tfidf_cosine(reference_counts, response_counts)
 
     ref_tokens = set(_tokenize_words(reference_text))
     response_tokens = set(_tokenize_words(response_text))
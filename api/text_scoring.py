@@ -0,0 +1,85 @@
+"""
+Text normalization, TF-IDF and batch helpers shared by the speaking and listening evaluators.
+
+The TF-IDF similarity mirrors sklearn's TfidfVectorizer (default tokenization,
+smooth idf, l2 norm) fitted on just the reference and the response. With two
+documents a term's idf is 1 when both use it and 1 + ln(3/2) otherwise, so the
+cosine is computed directly from term counts and no vectorizer is fitted.
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AbstractSet, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Default TfidfVectorizer tokenization and the smoothed idf of a term seen in one of two documents.
+TFIDF_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+TFIDF_SINGLE_DOC_IDF = 1.0 + math.log(3.0 / 2.0)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+# After whitespace is collapsed the only ASCII survivors of _NON_ALNUM_RE are a-z, 0-9 and ' '.
+_ASCII_NON_ALNUM_TABLE = str.maketrans("", "", "".join(
+    chr(code) for code in range(128)
+    if not ("a" <= chr(code) <= "z" or "0" <= chr(code) <= "9" or chr(code) == " ")
+))
+
+
+def preprocess_text(text: str) -> str:
+    """Lowercase, collapse whitespace and drop punctuation (keeps a-z, 0-9 and spaces)."""
+    text = _WHITESPACE_RE.sub(" ", str(text or "").lower()).strip()
+    if text.isascii():
+        return text.translate(_ASCII_NON_ALNUM_TABLE)
+    return _NON_ALNUM_RE.sub("", text)
+
+
+def tfidf_term_counts(text: str, stop_words: AbstractSet[str] = frozenset()) -> Counter:
+    """Term counts under TfidfVectorizer's default tokenization, minus stop_words."""
+    tokens = TFIDF_TOKEN_PATTERN.findall(str(text or "").lower())
+    if not stop_words:
+        return Counter(tokens)
+    return Counter(token for token in tokens if token not in stop_words)
+
+
+def two_document_tfidf_cosine(reference_counts: Counter, response_counts: Counter) -> float:
+    """Cosine of the two documents' TF-IDF vectors, computed from their term counts."""
+    dot = 0.0
+    reference_norm_sq = 0.0
+    for term, count in reference_counts.items():
+        response_count = response_counts.get(term)
+        if response_count:
+            dot += count * response_count
+            reference_norm_sq += count * count
+        else:
+            reference_norm_sq += (count * TFIDF_SINGLE_DOC_IDF) ** 2
+    response_norm_sq = 0.0
+    for term, count in response_counts.items():
+        idf = 1.0 if term in reference_counts else TFIDF_SINGLE_DOC_IDF
+        response_norm_sq += (count * idf) ** 2
+
+    if reference_norm_sq <= 0.0 or response_norm_sq <= 0.0:
+        return 0.0
+    return float(dot / math.sqrt(reference_norm_sq * response_norm_sq))
+
+
+def evaluate_batch(
+    evaluate_item: Callable[[Sequence], Dict],
+    items: Iterable[Sequence],
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+) -> List[Dict]:
+    """
+    Run evaluate_item over items, returning results in input order. Threads suit
+    batches where the semantic model dominates (torch releases the GIL);
+    use_processes=True trades worker start-up (each process loads references and
+    the model once) for full CPU scaling, and needs a module-level evaluate_item.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [evaluate_item(item) for item in items]
+    workers = max(1, min(len(items), max_workers or os.cpu_count() or 1))
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_cls(max_workers=workers) as executor:
+        return list(executor.map(evaluate_item, items))
@@ -1,14 +1,19 @@
+import atexit
 import os
 import shutil
+import socket
 import subprocess
 import json
 import re
 import uuid
 import time
 import sys
+import bisect
 import difflib
+import functools
 import concurrent.futures
 import hashlib
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -140,15 +145,111 @@ def _resolve_word_analysis_workers() -> int:
     return _safe_int_env(raw, default=1, minimum=1, maximum=8)
 
 
+def _resolve_mfa_accent_workers(accent_count: int, mfa_num_jobs: int) -> int:
+    """
+    Resolve how many accents align concurrently.
+    Default fits the accents' --num_jobs into the CPU count; PTE_MFA_ACCENT_WORKERS overrides.
+    """
+    raw = str(os.environ.get("PTE_MFA_ACCENT_WORKERS", "")).strip()
+    if raw:
+        workers = _safe_int_env(raw, default=1, minimum=1, maximum=8)
+    else:
+        workers = max(1, (os.cpu_count() or 1) // max(1, mfa_num_jobs))
+    return max(1, min(accent_count, workers))
+
+
+_ASR_EXECUTOR = None
+_ASR_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_asr_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared pool for ASR calls that overlap MFA alignment (PTE_ASR_WORKERS, default 4)."""
+    global _ASR_EXECUTOR
+    with _ASR_EXECUTOR_LOCK:
+        if _ASR_EXECUTOR is None:
+            workers = _safe_int_env(os.environ.get("PTE_ASR_WORKERS"), default=4, minimum=1, maximum=32)
+            _ASR_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="pte-asr"
+            )
+        return _ASR_EXECUTOR
+
+
+_MFA_REUSED_CONTAINER = None
+_MFA_REUSED_CONTAINER_LOCK = threading.Lock()
+
+
+def _remove_mfa_container(name: str) -> None:
+    try:
+        subprocess.run(
+            ["docker", "rm", "-f", name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+            check=False,
+        )
+    except Exception:
+        pass
+
+
+def _ensure_reused_mfa_container() -> Optional[str]:
+    """
+    Start one idle MFA container per process (PTE_MFA_REUSE_CONTAINER) so accents and
+    requests `docker exec` into it instead of paying container start-up per run.
+    Returns its name, or None if it could not be started (callers fall back to docker run).
+    """
+    global _MFA_REUSED_CONTAINER
+    if _MFA_REUSED_CONTAINER is not None:
+        return _MFA_REUSED_CONTAINER
+    with _MFA_REUSED_CONTAINER_LOCK:
+        if _MFA_REUSED_CONTAINER is None:
+            # Replicas sharing the host docker daemon can have the same small pids, so the
+            # name also carries the hostname and a random suffix; it never names a peer's container.
+            host = re.sub(r"[^a-zA-Z0-9_.-]+", "-", socket.gethostname()).strip("-.") or "host"
+            name = f"pte-mfa-{host}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            cmd = [
+                "docker", "run", "-d", "--rm",
+                "--name", name,
+                "-v", f"{MFA_DOCKER_BASE_SOURCE}:/models",
+                "-v", f"{MFA_DOCKER_RUNTIME_SOURCE}:/runtime",
+                "--entrypoint", "sleep",
+                DOCKER_IMAGE, "infinity",
+            ]
+            try:
+                result = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=120,
+                    check=False,
+                )
+            except Exception as exc:
+                print(f"[MFA] Could not start reusable container: {exc}")
+                return None
+            if result.returncode != 0:
+                stderr_text = result.stderr.decode("utf-8", errors="ignore") if result.stderr else ""
+                print(f"[MFA] Could not start reusable container: {stderr_text[:500]}")
+                return None
+            atexit.register(_remove_mfa_container, name)
+            print(f"[MFA] Started reusable container {name}")
+            _MFA_REUSED_CONTAINER = name
+    return _MFA_REUSED_CONTAINER
+
+
 def _resolve_mfa_runner_mode() -> tuple[str, Optional[str]]:
     """
     Return MFA runner mode.
     - docker_run: fresh container per request (current default)
     - docker_exec: execute inside persistent running container
+      (PTE_MFA_CONTAINER_NAME, or one started by this process with PTE_MFA_REUSE_CONTAINER)
     """
     container_name = str(os.environ.get("PTE_MFA_CONTAINER_NAME", "")).strip()
     if container_name:
         return "docker_exec", container_name
+    if _as_bool_env(os.environ.get("PTE_MFA_REUSE_CONTAINER")):
+        reused_container = _ensure_reused_mfa_container()
+        if reused_container:
+            return "docker_exec", reused_container
     return "docker_run", None
 
 
@@ -184,23 +285,30 @@ def _path_signature(path: Path) -> str:
         return "missing"
 
 
-def _build_result_cache_key(audio_path: str, reference_text: str, accent_keys: list[str]) -> str:
-    model_signatures = {}
-    for accent in accent_keys:
-        conf = ACCENTS_CONFIG.get(accent) or {}
-        dict_path = MFA_BASE_DIR / conf.get("dict_rel", "")
-        model_path = MFA_BASE_DIR / conf.get("model_rel", "")
-        model_signatures[accent] = {
-            "dict_rel": conf.get("dict_rel"),
-            "dict_sig": _path_signature(dict_path) if conf.get("dict_rel") else "missing",
-            "model_rel": conf.get("model_rel"),
-            "model_sig": _path_signature(model_path) if conf.get("model_rel") else "missing",
-        }
+def _accent_model_signature(accent: str) -> dict:
+    conf = ACCENTS_CONFIG.get(accent) or {}
+    dict_path = MFA_BASE_DIR / conf.get("dict_rel", "")
+    model_path = MFA_BASE_DIR / conf.get("model_rel", "")
+    return {
+        "dict_rel": conf.get("dict_rel"),
+        "dict_sig": _path_signature(dict_path) if conf.get("dict_rel") else "missing",
+        "model_rel": conf.get("model_rel"),
+        "model_sig": _path_signature(model_path) if conf.get("model_rel") else "missing",
+    }
+
+
+def _build_result_cache_key(
+    audio_path: str,
+    reference_text: str,
+    accent_keys: list[str],
+    audio_sha256: Optional[str] = None,
+) -> str:
+    model_signatures = {accent: _accent_model_signature(accent) for accent in accent_keys}
 
     payload = {
         "schema": CACHE_SCHEMA_VERSION,
         "pipeline": CACHE_PIPELINE_VERSION,
-        "audio_sha256": _sha256_file(audio_path),
+        "audio_sha256": audio_sha256 or _sha256_file(audio_path),
         "reference_text": reference_text.strip(),
         "accents": accent_keys,
         "docker_image": DOCKER_IMAGE,
@@ -212,18 +320,15 @@ def _build_result_cache_key(audio_path: str, reference_text: str, accent_keys: l
 
 def _load_cached_result(cache_key: str) -> Optional[dict]:
     cache_file = _result_cache_dir() / f"{cache_key}.json"
-    if not cache_file.exists():
-        return None
-
     max_age = _result_cache_max_age_seconds()
-    if max_age > 0:
-        age = time.time() - cache_file.stat().st_mtime
-        if age > max_age:
-            return None
-
     try:
         with open(cache_file, "r", encoding="utf-8") as in_file:
+            # fstat on the open handle: one lookup instead of exists() + stat() + open().
+            if max_age > 0 and time.time() - os.fstat(in_file.fileno()).st_mtime > max_age:
+                return None
             payload = json.load(in_file)
+    except FileNotFoundError:
+        return None
     except Exception as exc:
         print(f"[CACHE] Failed to read cache file {cache_file}: {exc}")
         return None
@@ -252,6 +357,81 @@ def _store_cached_result(cache_key: str, result: dict) -> None:
     os.replace(temp_file, cache_file)
 
 
+def _textgrid_cache_dir() -> Path:
+    cache_dir = MFA_RUNTIME_DIR / "result_cache" / "textgrid"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def _textgrid_cache_max_entries() -> int:
+    return _safe_int_env(os.environ.get("PTE_MFA_TEXTGRID_CACHE_MAX_ENTRIES"), default=512, minimum=1)
+
+
+def _build_textgrid_cache_key(audio_sha256: str, reference_text: str, accent: str) -> str:
+    """
+    Key for one accent's alignment. Unlike the result cache it ignores the scoring
+    pipeline version, so re-scoring after a pipeline bump still skips MFA.
+    """
+    payload = {
+        "audio_sha256": audio_sha256,
+        "reference_text": reference_text.strip(),
+        "accent": accent,
+        "docker_image": DOCKER_IMAGE,
+        "model": _accent_model_signature(accent),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _restore_cached_textgrid(cache_key: str, dst: Path) -> bool:
+    """Place a cached TextGrid at dst (this run's MFA output path); False on a miss."""
+    cache_file = _textgrid_cache_dir() / f"{cache_key}.TextGrid"
+    max_age = _result_cache_max_age_seconds()
+    try:
+        if max_age > 0 and time.time() - cache_file.stat().st_mtime > max_age:
+            return False
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        # Copy (TextGrids are small) so later writes to the run's TextGrid cannot reach the cache.
+        shutil.copyfile(cache_file, dst)
+        # Refresh mtime so pruning evicts the least recently used alignments first.
+        os.utime(cache_file)
+    except FileNotFoundError:
+        return False
+    except Exception as exc:
+        print(f"[CACHE] Failed to restore cached TextGrid {cache_file}: {exc}")
+        return False
+    return True
+
+
+def _store_cached_textgrid(cache_key: str, src: Path) -> None:
+    cache_dir = _textgrid_cache_dir()
+    temp_file = cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+    # Copy rather than hardlink, as on restore: entries never share an inode (or mtime) with run outputs.
+    shutil.copyfile(src, temp_file)
+    os.replace(temp_file, cache_dir / f"{cache_key}.TextGrid")
+    _prune_textgrid_cache(cache_dir, _textgrid_cache_max_entries())
+
+
+def _prune_textgrid_cache(cache_dir: Path, max_entries: int) -> None:
+    """Drop the least recently used TextGrids beyond max_entries."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".TextGrid"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 MFA_DOCKER_BASE_SOURCE = _resolve_docker_mount_source(MFA_BASE_DIR, MFA_DOCKER_MOUNT_BASE_DIR)
 MFA_DOCKER_RUNTIME_SOURCE = _resolve_docker_mount_source(MFA_RUNTIME_DIR, MFA_DOCKER_MOUNT_RUNTIME_DIR)
 
@@ -288,135 +468,171 @@ ACCENTS_CONFIG = {
 
 # --- Validation Logic (Ported from test_mfa_output.py) ---
 
+_NUMERIC_LEADING_CHARS = frozenset("0123456789.-+")
+
 def load_dictionary(path):
     """Load MFA dictionary mapping words to phone tuples."""
     pronunciations = {}
-    if not os.path.exists(path):
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
         print(f"Warning: Dictionary not found: {path}")
         return pronunciations
-        
-    with open(path, "r", encoding="utf-8") as f:
+
+    with f:
         for line in f:
-            parts = line.strip().split()
+            parts = line.split()
             if len(parts) > 1:
                 word = parts[0].lower()
+                # Skip probability columns; phones never start with a digit, sign or dot,
+                # so float() only runs on tokens that can actually be numbers.
                 phones_start_idx = 1
-                while phones_start_idx < len(parts):
+                while phones_start_idx < len(parts) and parts[phones_start_idx][0] in _NUMERIC_LEADING_CHARS:
                     try:
                         float(parts[phones_start_idx])
-                        phones_start_idx += 1
                     except ValueError:
                         break
+                    phones_start_idx += 1
                 phones = tuple(p.lower() for p in parts[phones_start_idx:])
                 if phones:
-                    if word not in pronunciations:
-                        pronunciations[word] = []
-                    pronunciations[word].append(phones)
+                    pronunciations.setdefault(word, []).append(phones)
     return pronunciations
 
+_STRESS_DIGITS_RE = re.compile(r'\d+')
+_SILENCE_PHONES = frozenset(('sil', 'sp', 'spn'))
+
+@functools.lru_cache(maxsize=512)
 def normalize_phone(p, keep_stress=False):
-    """Normalize phone string (lowercase, optionally remove stress)."""
+    """Normalize phone string (lowercase, optionally remove stress); phone inventories are tiny, so cached."""
     p = p.lower()
     if not keep_stress:
-        p = re.sub(r'\d+', '', p)
+        p = _STRESS_DIGITS_RE.sub('', p)
     return p
 
+@functools.lru_cache(maxsize=65536)
+def _pronunciation_variants(phones):
+    """(no-stress, with-stress) normalized tuples for one dictionary pronunciation (a phone tuple)."""
+    return (
+        tuple(normalize_phone(p, keep_stress=False) for p in phones),
+        tuple(normalize_phone(p, keep_stress=True) for p in phones),
+    )
+
 def validate_pronunciation(word, observed_phones, dictionary):
     """Validate if observed phones match any valid pronunciation in the dictionary."""
     if word.lower() not in dictionary:
         return False, "OOV", False
         
     valid_prons = dictionary[word.lower()]
-    obs_norm = [normalize_phone(p, keep_stress=False) for p in observed_phones if p not in ('sil', 'sp', 'spn')]
+    # One pass over the observed phones for both normalized forms.
+    obs_norm = []
+    obs_stress = []
+    for p in observed_phones:
+        if p in _SILENCE_PHONES:
+            continue
+        obs_norm.append(normalize_phone(p, keep_stress=False))
+        obs_stress.append(normalize_phone(p, keep_stress=True))
+    obs_norm = tuple(obs_norm)
+    obs_stress = tuple(obs_stress)
     
     if not obs_norm:
         return False, "No phones detected", False
 
-    phoneme_matches = []
+    # Stress variants of the pronunciations whose phonemes match (tuple equality).
+    matched_stress = []
     for valid_pron in valid_prons:
-        val_norm = [normalize_phone(p, keep_stress=False) for p in valid_pron]
+        val_norm, val_stress = _pronunciation_variants(tuple(valid_pron))
         if obs_norm == val_norm:
-            phoneme_matches.append(valid_pron)
+            matched_stress.append(val_stress)
             
-    if not phoneme_matches:
+    if not matched_stress:
         return False, "Mismatch", False
         
-    # Stress Check
-    obs_stress = [normalize_phone(p, keep_stress=True) for p in observed_phones if p not in ('sil', 'sp', 'spn')]
-    has_stress_info = any(re.search(r'\d', p) for p in obs_stress)
+    # Stress Check (stripping stress digits only changes phones that carry them)
+    has_stress_info = obs_stress != obs_norm
     
     if not has_stress_info:
         return True, "Exact Match (No Stress Info)", True
         
-    for valid_pron in phoneme_matches:
-        val_stress = [normalize_phone(p, keep_stress=True) for p in valid_pron]
-        if obs_stress == val_stress:
-            return True, "Exact Match (With Stress)", True
+    if obs_stress in matched_stress:
+        return True, "Exact Match (With Stress)", True
             
     return True, "Stress Mismatch", False
 
-def parse_textgrid(path, target_tier):
+def _parse_textgrid_lines(lines, target_tiers):
     """
-    Robust manual TextGrid parser.
-    Extracts intervals from the specified tier ('words' or 'phones').
-    Returns list of dicts: {'value': text, 'start': float, 'end': float, ...}
+    Single-pass state machine over TextGrid lines.
+    Returns {tier: [{'value': text, 'start': float, 'end': float, ...}]} for each requested tier.
+    """
+    tiers = {tier: [] for tier in target_tiers}
+    current_items = None
+    in_interval = False
+    current_item = {}
+
+    for line in lines:
+        line = line.strip()
+
+        # A name= line starts the next tier; collect it only if it was requested.
+        if line.startswith('name ='):
+            name = line.split('=')[1].strip().strip('"')
+            current_items = tiers.get(name)
+            in_interval = False
+
+        if current_items is not None:
+            if line.startswith('intervals ['):
+                in_interval = True
+                current_item = {}
+
+            if in_interval:
+                if line.startswith('xmin ='):
+                    try: current_item['start'] = float(line.split('=')[1].strip())
+                    except: pass
+                elif line.startswith('xmax ='):
+                    try: current_item['end'] = float(line.split('=')[1].strip())
+                    except: pass
+                elif line.startswith('text ='):
+                    text = line.split('=')[1].strip().strip('"')
+                    # Only keep non-empty text
+                    if text:
+                        current_item['value'] = text
+                        current_item['word'] = text # Alias for words
+                        current_item['label'] = text # Alias for phones
+                        if 'start' in current_item and 'end' in current_item:
+                            current_items.append(current_item)
+
+                    in_interval = False # End of interval data
+
+    return tiers
+
+def read_textgrid(path, target_tiers=("words", "phones")):
+    """
+    Read a TextGrid once and parse the requested tiers in one pass.
+    Returns (raw_text, {tier: items}); raw_text is "" when the file is missing or unreadable.
     """
-    items = []
-    if not os.path.exists(path):
-        return items
+    if not path:
+        return "", {tier: [] for tier in target_tiers}
 
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            content = f.read()
+    except FileNotFoundError:
+        return "", {tier: [] for tier in target_tiers}
+    except Exception as e:
+        print(f"[DEBUG] Failed to read TextGrid {path}: {e}")
+        return "", {tier: [] for tier in target_tiers}
 
-        in_target_tier = False
-        in_interval = False
-        current_item = {}
-        
-        # Simple state machine
-        for line in lines:
-            line = line.strip()
-            
-            # check for tier start
-            if line.startswith('name ='):
-                if '=' in line:
-                    name = line.split('=')[1].strip().strip('"')
-                    if name == target_tier:
-                        in_target_tier = True
-                    # Only reset if we find another name= line (start of next tier)
-                    # and we were already in target tier?
-                    # Actually, if we are in target tier, and see name=, it means NEXT tier started.
-                    elif in_target_tier:
-                        in_target_tier = False
-            
-            if in_target_tier:
-                if line.startswith('intervals ['):
-                    in_interval = True
-                    current_item = {}
-                
-                if in_interval:
-                    if line.startswith('xmin ='):
-                        try: current_item['start'] = float(line.split('=')[1].strip())
-                        except: pass
-                    elif line.startswith('xmax ='):
-                        try: current_item['end'] = float(line.split('=')[1].strip())
-                        except: pass
-                    elif line.startswith('text ='):
-                        text = line.split('=')[1].strip().strip('"')
-                        # Only keep non-empty text
-                        if text:
-                            current_item['value'] = text
-                            current_item['word'] = text # Alias for words
-                            current_item['label'] = text # Alias for phones
-                            if 'start' in current_item and 'end' in current_item:
-                                items.append(current_item)
-                        
-                        in_interval = False # End of interval data
-                        
+    try:
+        return content, _parse_textgrid_lines(content.splitlines(), target_tiers)
     except Exception as e:
         print(f"[DEBUG] Failed to parse TextGrid {path}: {e}")
-        
-    return items
+        return content, {tier: [] for tier in target_tiers}
+
+def parse_textgrid(path, target_tier):
+    """
+    Robust manual TextGrid parser.
+    Extracts intervals from the specified tier ('words' or 'phones').
+    Returns list of dicts: {'value': text, 'start': float, 'end': float, ...}
+    """
+    return read_textgrid(path, (target_tier,))[1][target_tier]
 
 def read_textgrid_words(path):
     """Read words from TextGrid using manual parser."""
@@ -426,38 +642,64 @@ def read_textgrid_phones(path):
     """Read phones from TextGrid using manual parser."""
     return parse_textgrid(path, "phones")
 
-def get_phones_for_word(word_info, all_phones):
-    """Extract phones corresponding to a specific word time range."""
-    w_start = word_info['start']
-    w_end = word_info['end']
-    word_phones = []
+def build_phone_starts(all_phones):
+    """
+    Start times of all_phones for bisect lookups, or None when the phones are not
+    time-ordered with complete timings (callers then fall back to a linear scan).
+    """
+    starts = []
+    previous = float('-inf')
     for p in all_phones:
-        if p['start'] >= w_start - 0.01 and p['end'] <= w_end + 0.01:
-            word_phones.append(p['label'])
-    return word_phones
+        p_start = p.get('start')
+        p_end = p.get('end')
+        if p_start is None or p_end is None or p_start < previous or p_end < p_start:
+            return None
+        starts.append(p_start)
+        previous = p_start
+    return starts
 
 
-def get_phone_intervals_for_word(word_info, all_phones, tolerance=0.01):
-    """Return phone intervals that fall inside a word's MFA time range."""
+def get_phones_for_word(word_info, all_phones, phone_starts=None):
+    """Extract phones corresponding to a specific word time range."""
+    return [p['label'] for p in get_phone_intervals_for_word(word_info, all_phones, phone_starts=phone_starts)]
+
+
+def get_phone_intervals_for_word(word_info, all_phones, tolerance=0.01, phone_starts=None):
+    """
+    Return phone intervals that fall inside a word's MFA time range.
+    With phone_starts from build_phone_starts, only the phones starting inside the
+    window are visited (bisect) instead of scanning every phone.
+    """
     if not word_info:
         return []
     w_start = word_info.get('start')
     w_end = word_info.get('end')
     if w_start is None or w_end is None:
         return []
+    lower = w_start - tolerance
+    upper = w_end + tolerance
     intervals = []
+    if phone_starts is not None:
+        for idx in range(bisect.bisect_left(phone_starts, lower), len(phone_starts)):
+            if phone_starts[idx] > upper:
+                break
+            p = all_phones[idx]
+            if p['end'] <= upper:
+                intervals.append(p)
+        return intervals
+
     for p in all_phones:
         p_start = p.get('start')
         p_end = p.get('end')
         if p_start is None or p_end is None:
             continue
-        if p_start >= w_start - tolerance and p_end <= w_end + tolerance:
+        if p_start >= lower and p_end <= upper:
             intervals.append(p)
     return intervals
 
 
 def _normalize_word_key(word):
-    return re.sub(r"[^a-z0-9']+", "", str(word or "").lower())
+    return _NON_WORD_CHARS_RE.sub("", str(word or "").lower())
 
 
 def build_ref_word_to_mfa_map(diff_analysis, base_words):
@@ -502,46 +744,85 @@ def transcribe_audio(audio_path):
         print(f"ASR failed: {e}")
         return ""
 
+_TRANSCRIPT_PUNCT_TABLE = str.maketrans('', '', '.,!?;:"')
+# ASCII transcripts lowercase and drop punctuation in the same translate pass.
+_TRANSCRIPT_ASCII_TABLE = {**_TRANSCRIPT_PUNCT_TABLE, **{code: code + 32 for code in range(ord('A'), ord('Z') + 1)}}
+_NON_WORD_CHARS_RE = re.compile(r"[^a-z0-9']+")
+
+
+@functools.lru_cache(maxsize=256)
+def _tokenize_reference(text):
+    """Reference words with trailing pause punctuation (,.) split out as its own token; cached per passage."""
+    tokens = []
+    for word in text.split():
+        clean_word = word.lower()
+        # Check for any punctuation in our set at the end of the word
+        found_punct = None
+        word_part = clean_word
+
+        # Simple check for trailing punctuation
+        if clean_word and clean_word[-1] in PAUSE_PUNCTUATION:
+            found_punct = clean_word[-1]
+            word_part = clean_word[:-1]
+
+        # Only keep alphanumeric + apostrophe
+        word_part = _NON_WORD_CHARS_RE.sub("", word_part)
+
+        if word_part:
+            tokens.append(word_part)
+        if found_punct:
+            tokens.append(found_punct)
+    return tuple(tokens)
+
+
+def _tokenize_transcript(text):
+    if text.isascii():
+        return text.translate(_TRANSCRIPT_ASCII_TABLE).split()
+    return text.lower().translate(_TRANSCRIPT_PUNCT_TABLE).split()
+
+
+def _word_opcodes(ref_words, trans_words):
+    """
+    (tag, i1, i2, j1, j2) edit opcodes between two word lists. Shared leading and
+    trailing words are emitted as 'equal' up front so only the differing middle is diffed.
+    The middle uses difflib rather than a minimum-edit aligner: edit distance breaks ties
+    between equally cheap alignments with substitutions, which marks spoken words as missed.
+    """
+    ref_len, trans_len = len(ref_words), len(trans_words)
+    limit = min(ref_len, trans_len)
+    prefix = 0
+    while prefix < limit and ref_words[prefix] == trans_words[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and ref_words[ref_len - 1 - suffix] == trans_words[trans_len - 1 - suffix]:
+        suffix += 1
+
+    opcodes = []
+    if prefix:
+        opcodes.append(('equal', 0, prefix, 0, prefix))
+    ref_mid = ref_words[prefix:ref_len - suffix]
+    trans_mid = trans_words[prefix:trans_len - suffix]
+    if ref_mid or trans_mid:
+        middle = difflib.SequenceMatcher(None, ref_mid, trans_mid, autojunk=False).get_opcodes()
+        for tag, i1, i2, j1, j2 in middle:
+            opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(('equal', ref_len - suffix, ref_len, trans_len - suffix, trans_len))
+    return opcodes
+
+
 def compare_text(reference_text, transcription):
     """
-    Compare reference text with transcription using difflib.
+    Compare reference text with transcription using word-level difflib opcodes.
     Returns a list of word objects with status: 'correct', 'omitted', 'inserted', 'substituted'.
     Preserves punctuation marks (,.) for pause scoring.
     """
-    def tokenize(text, preserve_pause_punct=True):
-        if not preserve_pause_punct:
-            return [w.strip(".,!?;:\"").lower() for w in text.split()]
-        
-        # Split by whitespace, then separate trailing pause punctuation
-        tokens = []
-        for word in text.split():
-            clean_word = word.lower()
-            # Check for any punctuation in our set at the end of the word
-            found_punct = None
-            word_part = clean_word
-            
-            # Simple check for trailing punctuation
-            if clean_word and clean_word[-1] in PAUSE_PUNCTUATION:
-                found_punct = clean_word[-1]
-                word_part = clean_word[:-1]
-            
-            # Strip other non-pause punctuation
-            word_part = word_part.strip("!?;:\"") # Clean leading/trailing
-            word_part = re.sub(r"[^a-z0-9']+", "", word_part) # Only keep alphanumeric + apostrophe
-            
-            if word_part:
-                tokens.append(word_part)
-            if found_punct:
-                tokens.append(found_punct)
-        return [t for t in tokens if t]
-
-    ref_words = tokenize(reference_text)
-    trans_words = tokenize(transcription, preserve_pause_punct=False) # Transcriptions usually don't have punct
+    ref_words = _tokenize_reference(reference_text)
+    trans_words = _tokenize_transcript(transcription) # Transcriptions usually don't have punct
     
-    matcher = difflib.SequenceMatcher(None, ref_words, trans_words)
     diff_results = []
     
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in _word_opcodes(ref_words, trans_words):
         if tag == 'equal':
             # Words match
             for k, l in zip(range(i1, i2), range(j1, j2)):
@@ -614,17 +895,16 @@ def calculate_word_gaps(word_alignments, threshold=0.0):
     if len(word_alignments) < 2:
         return gaps
 
-    sorted_words = sorted(
-        [w for w in word_alignments if w.get("start") is not None and w.get("end") is not None],
-        key=lambda item: item.get("start", 0.0),
-    )
-
-    for current_word, next_word in zip(sorted_words, sorted_words[1:]):
-        current_end = current_word.get("end")
-        next_start = next_word.get("start")
-        if current_end is None or next_start is None:
-            continue
+    # Read each word's timing once; words without both timestamps cannot bound a gap.
+    timed_words = []
+    for word in word_alignments:
+        start = word.get("start")
+        end = word.get("end")
+        if start is not None and end is not None:
+            timed_words.append((start, end, word))
+    timed_words.sort(key=lambda item: item[0])
 
+    for (_, current_end, current_word), (next_start, _, next_word) in zip(timed_words, timed_words[1:]):
         gap = next_start - current_end
         if gap <= threshold:
             continue
@@ -697,6 +977,29 @@ def transcribe_audio_with_details(audio_path):
         return {"text": "", "word_timestamps": []}
 
 
+def _analyze_transcript(reference_text, asr_result):
+    """Derive transcript, word timestamps, speech-rate scale and the reference diff from an ASR result."""
+    transcript = asr_result.get("text", "")
+    word_timestamps = asr_result.get("word_timestamps", [])
+    speech_rate_scale = calculate_speech_rate_scale(word_timestamps)
+    diff_analysis, _ = compare_text(reference_text, transcript)
+    return transcript, word_timestamps, speech_rate_scale, diff_analysis
+
+
+def _has_recognized_reference_word(diff_analysis):
+    return any(item['status'] == 'correct' and not is_punctuation(item['word']) for item in diff_analysis)
+
+
+def _stage_mfa_input(src, dst):
+    """
+    Place an input file in the MFA runtime dir: hardlink when src is on the same
+    filesystem (no byte copy), otherwise copy the data without metadata.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
 def build_asr_only_result(
     diff_analysis,
     transcript,
@@ -764,7 +1067,11 @@ def run_single_alignment_gen(accent, conf, run_id, docker_input_dir, error_sink=
         "--num_jobs", str(mfa_num_jobs),
     ]
     if runner_mode == "docker_exec" and persistent_container:
-        cmd = ["docker", "exec", persistent_container] + align_args
+        # Runs share the container, so each needs its own MFA temp dir; otherwise they all use
+        # ~/Documents/MFA/input and one run's --clean wipes another's corpus state.
+        cmd = ["docker", "exec", persistent_container] + align_args + [
+            "--temporary_directory", f"/runtime/{run_id}/tmp/{accent}",
+        ]
     else:
         cmd = [
             "docker", "run", "--rm",
@@ -775,11 +1082,12 @@ def run_single_alignment_gen(accent, conf, run_id, docker_input_dir, error_sink=
     
     process = None
     try:
-        # Use Popen to allow polling/heartbeats
+        # Use Popen to allow polling/heartbeats. stdout is never read (--quiet), so it is
+        # not piped; stderr is kept for the failure log.
         process = subprocess.Popen(
             cmd, 
             stdin=subprocess.DEVNULL,  # Prevent hanging on input requests
-            stdout=subprocess.PIPE, 
+            stdout=subprocess.DEVNULL, 
             stderr=subprocess.PIPE
         )
         
@@ -791,7 +1099,7 @@ def run_single_alignment_gen(accent, conf, run_id, docker_input_dir, error_sink=
         while True:
             try:
                 # Wait for 2 seconds
-                stdout, stderr = process.communicate(timeout=2)
+                _, stderr = process.communicate(timeout=2)
                 # If we get here without TimeoutExpired, process finished
                 elapsed = int(time.time() - start_time)
                 
@@ -847,6 +1155,84 @@ def run_single_alignment_gen(accent, conf, run_id, docker_input_dir, error_sink=
             print(f"[MFA] Cleaning up process for {accent}")
             process.kill()
 
+def _drain_alignment(accent, conf, run_id, docker_input_dir, error_sink, cancel_event=None):
+    """
+    Run one accent's alignment to completion (worker-thread body); returns the TextGrid path or None.
+    Once cancel_event is set, the next heartbeat closes the alignment generator, which kills its MFA process.
+    """
+    try:
+        try:
+            alignment_iter = run_single_alignment_gen(
+                accent,
+                conf,
+                run_id,
+                docker_input_dir,
+                error_sink=error_sink,
+            )
+        except TypeError:
+            # Backward-compatible path for tests/mocks with the legacy signature.
+            alignment_iter = run_single_alignment_gen(accent, conf, run_id, docker_input_dir)
+
+        tg_file = None
+        for msg in alignment_iter:
+            if msg['type'] == 'result':
+                _, tg_file = msg['data']
+            elif cancel_event is not None and cancel_event.is_set():
+                print(f"[MFA] Cancelling alignment for {accent}")
+                close = getattr(alignment_iter, "close", None)
+                if close:
+                    close()
+                return None
+        return tg_file
+    except Exception as e:
+        print(f"[DEBUG] Error running alignment for {accent}: {e}")
+        return None
+
+
+def _align_accents_concurrently(
+    target_accents, run_id, docker_input_dir, accent_tgs, mfa_errors, max_workers, should_stop=None
+):
+    """
+    Align several accents at once (each is an independent docker run with its own
+    output dir), filling accent_tgs/mfa_errors and yielding heartbeats while waiting.
+    Stops early (killing the running alignments) once should_stop() returns True.
+    """
+    start_time = time.time()
+    cancel_event = threading.Event()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pte-mfa-accent")
+    futures = {
+        executor.submit(_drain_alignment, accent, conf, run_id, docker_input_dir, mfa_errors, cancel_event): accent
+        for accent, conf in target_accents.items()
+    }
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, timeout=2, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                accent = futures[future]
+                tg_file = future.result()
+                print(f"[DEBUG] Validated run_single_alignment result: {accent}, {tg_file}")
+                if tg_file:
+                    accent_tgs[accent] = tg_file
+            if pending and should_stop is not None and should_stop():
+                print("[DEBUG] Stopping remaining MFA alignments early.")
+                return
+            if pending:
+                elapsed = int(time.time() - start_time)
+                yield {
+                    "type": "progress",
+                    "percent": 30 + min(40, int((elapsed / 180) * 40)),
+                    "message": f"Aligning {len(futures) - len(pending)}/{len(futures)} accents ({elapsed}s)...",
+                }
+    finally:
+        # On client disconnect, stop the running MFA processes (at their next heartbeat)
+        # without blocking the generator on them.
+        cancel_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def run_single_alignment(accent, conf, run_id, docker_input_dir):
     """Wrapper for backward compatibility (blocking)."""
     for msg in run_single_alignment_gen(accent, conf, run_id, docker_input_dir):
@@ -864,9 +1250,11 @@ def analyze_word_pronunciation(
     builder,
     scorer,
     accent,
+    phone_starts=None,
 ):
     """
     Analyze a single word pronunciation using cached MFA structures when available.
+    phone_starts (from build_phone_starts) enables bisect phone lookups.
     """
     res_entry = item.copy()
 
@@ -875,7 +1263,9 @@ def analyze_word_pronunciation(
     word_phone_intervals = []
 
     if matched_word:
-        word_phone_intervals = get_phone_intervals_for_word(matched_word, all_mfa_phones)
+        word_phone_intervals = get_phone_intervals_for_word(
+            matched_word, all_mfa_phones, phone_starts=phone_starts
+        )
         if word_phone_intervals:
             s = word_phone_intervals[0]['start']
             e = word_phone_intervals[-1]['end']
@@ -1096,11 +1486,15 @@ def build_word_level_feedback(words):
         "message": " ".join(highlights),
     }
 
-def align_and_validate_gen(audio_path, text_path, accents=None):
+def align_and_validate_gen(audio_path, text_path, accents=None, reference_text=None, asr_result=None):
     """
     Generator version of align_and_validate for real-time progress updates.
     Yields: {"type": "progress", "percent": int, "message": str}
     Finally yields: {"type": "result", "data": dict}
+
+    Callers that already hold the reference text and/or a voice2text result
+    can pass them in-memory (text_path may then be None) to skip the
+    transcript temp file and a second ASR pass.
     """
     # Use specified accents or default to US_ARPA only (optimization)
     if accents:
@@ -1114,13 +1508,17 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
     
     # --- Step 1: ASR Transcription & Content Check ---
     yield {"type": "progress", "percent": 5, "message": "Analyzing audio..."}
-    with open(text_path, 'r', encoding='utf-8') as f:
-        reference_text = f.read().strip()
+    if reference_text is None:
+        with open(text_path, 'r', encoding='utf-8') as f:
+            reference_text = f.read()
+    reference_text = str(reference_text).strip()
 
     cache_key = None
+    audio_sha256 = None
     if _result_cache_enabled():
         try:
-            cache_key = _build_result_cache_key(audio_path, reference_text, accent_keys)
+            audio_sha256 = _sha256_file(audio_path)
+            cache_key = _build_result_cache_key(audio_path, reference_text, accent_keys, audio_sha256=audio_sha256)
             cached_result = _load_cached_result(cache_key)
             if cached_result:
                 cached_meta = cached_result.setdefault("meta", {})
@@ -1139,16 +1537,12 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
             print(f"[CACHE] Cache lookup failed: {exc}")
 
     yield {"type": "progress", "percent": 10, "message": "Analyzing audio..."}
-    asr_result = transcribe_audio_with_details(audio_path)
-    transcript = asr_result.get("text", "")
-    word_timestamps = asr_result.get("word_timestamps", [])
-    
-    yield {"type": "progress", "percent": 15, "message": "Evaluating content..."}
-    speech_rate_scale = calculate_speech_rate_scale(word_timestamps)
-    
-    yield {"type": "progress", "percent": 20, "message": "Evaluating content..."}
-    diff_analysis, _ = compare_text(reference_text, transcript)
-    
+    # MFA aligns against the reference text, not the transcript, so a fresh ASR
+    # pass runs in the background while the alignment does.
+    asr_future = None
+    if asr_result is None:
+        asr_future = _get_asr_executor().submit(transcribe_audio_with_details, audio_path)
+
     # --- Step 2: MFA Alignment ---
     
     # Unique ID for this run
@@ -1158,7 +1552,41 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
     mfa_disabled = _as_bool_env(os.environ.get("PTE_SKIP_MFA"))
     docker_ready, docker_reason = _is_docker_ready()
     using_builtin_mfa_runner = getattr(run_single_alignment_gen, "__module__", "") == __name__
-    if mfa_disabled or (using_builtin_mfa_runner and not docker_ready):
+    mfa_unavailable = mfa_disabled or (using_builtin_mfa_runner and not docker_ready)
+
+    # Join ASR now when MFA cannot run, or when it already finished (the docker probe
+    # above takes a moment) so a recording with no reference words skips docker below.
+    if asr_future is not None and (mfa_unavailable or asr_future.done()):
+        asr_result = asr_future.result()
+        asr_future = None
+    if asr_future is None:
+        yield {"type": "progress", "percent": 15, "message": "Evaluating content..."}
+        transcript, word_timestamps, speech_rate_scale, diff_analysis = _analyze_transcript(
+            reference_text, asr_result
+        )
+        yield {"type": "progress", "percent": 20, "message": "Evaluating content..."}
+
+    if asr_future is None and not _has_recognized_reference_word(diff_analysis):
+        # Nothing in the transcript matches the reference, so there is nothing for MFA to score.
+        print("[DEBUG] Skipping MFA: no reference words recognized.")
+        yield {"type": "progress", "percent": 30, "message": "No reference words recognized; skipping alignment."}
+        yield {
+            "type": "result",
+            "data": build_asr_only_result(
+                diff_analysis,
+                transcript,
+                speech_rate_scale,
+                word_timestamps,
+                run_id,
+                "Phoneme-level analysis skipped: no reference words were recognized.",
+                mfa_runner_mode=mfa_runner_mode,
+                mfa_num_jobs=mfa_num_jobs,
+                cache_key=cache_key,
+            ),
+        }
+        return
+
+    if mfa_unavailable:
         reason = "MFA disabled by PTE_SKIP_MFA." if mfa_disabled else docker_reason
         print(f"[DEBUG] Skipping MFA: {reason}")
         yield {"type": "progress", "percent": 30, "message": "MFA unavailable; using ASR fallback."}
@@ -1178,6 +1606,17 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
         }
         return
 
+    asr_verdict = []
+
+    def asr_rules_out_alignment():
+        """True once the background ASR has finished without recognizing any reference word."""
+        if asr_future is None or not asr_future.done():
+            return False
+        if not asr_verdict:
+            verdict_diff, _ = compare_text(reference_text, asr_future.result().get("text", ""))
+            asr_verdict.append(not _has_recognized_reference_word(verdict_diff))
+        return asr_verdict[0]
+
     run_host_dir = MFA_RUNTIME_DIR / run_id
     temp_host_dir = run_host_dir / "input"
     output_host_dir = run_host_dir / "output"
@@ -1193,8 +1632,11 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
     try:
         yield {"type": "progress", "percent": 25, "message": "Checking pronunciation..."}
         # Copy inputs
-        shutil.copy(audio_path, temp_host_dir / "input.wav")
-        shutil.copy(text_path, temp_host_dir / "input.txt")
+        _stage_mfa_input(audio_path, temp_host_dir / "input.wav")
+        if text_path:
+            _stage_mfa_input(text_path, temp_host_dir / "input.txt")
+        else:
+            (temp_host_dir / "input.txt").write_text(reference_text, encoding="utf-8")
         
         # Docker paths
         docker_input_dir = f"/runtime/{run_id}/input"
@@ -1214,8 +1656,38 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
         except Exception as e:
              print(f"[DEBUG] Failed to yield progress: {e}")
 
-        # Sequential Loop instead of ThreadPoolExecutor
-        for accent, conf in target_accents.items():
+        # Re-scoring the same audio and text reuses earlier alignments instead of running docker.
+        textgrid_cache_keys = {}
+        if _result_cache_enabled():
+            try:
+                audio_sha256 = audio_sha256 or _sha256_file(audio_path)
+                for accent in target_accents:
+                    textgrid_cache_keys[accent] = _build_textgrid_cache_key(audio_sha256, reference_text, accent)
+                    tg_file = output_host_dir / accent / "input.TextGrid"
+                    if _restore_cached_textgrid(textgrid_cache_keys[accent], tg_file):
+                        print(f"[CACHE] Reusing cached TextGrid for {accent}")
+                        accent_tgs[accent] = tg_file
+            except Exception as exc:
+                print(f"[CACHE] TextGrid cache lookup failed: {exc}")
+        cached_accents = set(accent_tgs)
+        pending_accents = {a: conf for a, conf in target_accents.items() if a not in cached_accents}
+        if asr_rules_out_alignment():
+            print("[DEBUG] Skipping MFA: no reference words recognized.")
+            pending_accents = {}
+
+        # Several accents align concurrently; a single accent keeps the streaming sequential path.
+        sequential_accents = pending_accents
+        accent_workers = _resolve_mfa_accent_workers(len(pending_accents), mfa_num_jobs)
+        if accent_workers > 1:
+            sequential_accents = {}
+            yield from _align_accents_concurrently(
+                pending_accents, run_id, docker_input_dir, accent_tgs, mfa_errors, accent_workers,
+                should_stop=asr_rules_out_alignment,
+            )
+
+        for accent, conf in sequential_accents.items():
+            if asr_rules_out_alignment():
+                break
             print(f"[DEBUG] Processing accent: {accent}")
             try:
                 # Run alignment using generator to keep connection alive with heartbeats
@@ -1233,6 +1705,13 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
                     alignment_iter = run_single_alignment_gen(accent, conf, run_id, docker_input_dir)
 
                 for msg in alignment_iter:
+                    if msg['type'] == 'progress' and asr_rules_out_alignment():
+                        # ASR found none of the reference words: closing the generator kills MFA.
+                        print(f"[DEBUG] Stopping MFA for {accent}: no reference words recognized.")
+                        close = getattr(alignment_iter, "close", None)
+                        if close:
+                            close()
+                        break
                     if msg['type'] == 'progress':
                         # Re-yield progress to keep client connection alive
                         try:
@@ -1265,6 +1744,34 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
                          raise e
 
         print(f"[DEBUG] All MFA alignments done. accent_tgs: {list(accent_tgs.keys())}")
+        for accent, tg_file in accent_tgs.items():
+            if accent in textgrid_cache_keys and accent not in cached_accents:
+                try:
+                    _store_cached_textgrid(textgrid_cache_keys[accent], tg_file)
+                except Exception as exc:
+                    print(f"[CACHE] Failed to store TextGrid for {accent}: {exc}")
+
+        if asr_future is not None:
+            transcript, word_timestamps, speech_rate_scale, diff_analysis = _analyze_transcript(
+                reference_text, asr_future.result()
+            )
+            if not _has_recognized_reference_word(diff_analysis):
+                print("[DEBUG] Discarding MFA output: no reference words recognized.")
+                yield {
+                    "type": "result",
+                    "data": build_asr_only_result(
+                        diff_analysis,
+                        transcript,
+                        speech_rate_scale,
+                        word_timestamps,
+                        run_id,
+                        "Phoneme-level analysis skipped: no reference words were recognized.",
+                        mfa_runner_mode=mfa_runner_mode,
+                        mfa_num_jobs=mfa_num_jobs,
+                        cache_key=cache_key,
+                    ),
+                }
+                return
         
         # --- Step 3: Combine Results & Evaluate Pauses ---
         try:
@@ -1309,8 +1816,11 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
             return
             
         print(f"[DEBUG] Using base_tg: {base_tg}")
-        base_words = read_textgrid_words(base_tg)
-        all_mfa_phones = read_textgrid_phones(base_tg)
+        # One read + one parse pass for both tiers; the raw text is reused for textgrid_content.
+        textgrid_content, base_tiers = read_textgrid(base_tg, ("words", "phones"))
+        base_words = base_tiers["words"]
+        all_mfa_phones = base_tiers["phones"]
+        mfa_phone_starts = build_phone_starts(all_mfa_phones)
         ref_to_mfa_map = build_ref_word_to_mfa_map(diff_analysis, base_words)
         mfa_word_gaps = calculate_word_gaps(base_words, threshold=1e-4)
 
@@ -1399,6 +1909,7 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
                         builder,
                         scorer,
                         scoring_accent,
+                        phone_starts=mfa_phone_starts,
                     )
                 except Exception as exc:
                     print(f"Word analysis exception at index {idx}: {exc}")
@@ -1429,6 +1940,7 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
                         builder,
                         scorer,
                         scoring_accent,
+                        phone_starts=mfa_phone_starts,
                     )
                     futures.append((idx, item, future))
 
@@ -1563,15 +2075,6 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
         
         print(f"[DEBUG] Yielding final result...")
         
-        # Read TextGrid content for debug visibility
-        textgrid_content = ""
-        try:
-            if base_tg and os.path.exists(base_tg):
-                with open(base_tg, 'r', encoding='utf-8') as f:
-                    textgrid_content = f.read()
-        except Exception as e:
-            print(f"Failed to read TextGrid for debug: {e}")
-
         result_payload = {
             "textgrid_content": textgrid_content,
             "words": final_results,
@@ -1639,11 +2142,17 @@ def align_and_validate_gen(audio_path, text_path, accents=None):
 
 # --- Alignment Workflow ---
 
-def align_and_validate(audio_path, text_path, accents=None):
+def align_and_validate(audio_path, text_path, accents=None, reference_text=None, asr_result=None):
     """
     Synchronous version of align_and_validate_gen.
     """
-    gen = align_and_validate_gen(audio_path, text_path, accents=accents)
+    gen = align_and_validate_gen(
+        audio_path,
+        text_path,
+        accents=accents,
+        reference_text=reference_text,
+        asr_result=asr_result,
+    )
     final_result = None
     for update in gen:
         if update['type'] == 'result':
@@ -15,14 +15,12 @@ from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import requests
-
 from src.shared.paths import (
     SWT_WRITING_REFERENCE_FILE,
     ESSAY_WRITING_REFERENCE_FILE,
     EMAIL_WRITING_REFERENCE_FILE,
 )
-from src.shared.services import GRAMMAR_SERVICE_URL
+from src.shared.services import GRAMMAR_SERVICE_URL, get_service_session
 
 
 STOPWORDS = {
@@ -214,7 +212,7 @@ def _fetch_grammar_matches(text: str, timeout: float = 6.0) -> Dict:
         return payload
 
     try:
-        response = requests.post(GRAMMAR_SERVICE_URL, json={"text": clean_text}, timeout=timeout)
+        response = get_service_session().post(GRAMMAR_SERVICE_URL, json={"text": clean_text}, timeout=timeout)
         if response.status_code != 200:
             return payload
         data = response.json()
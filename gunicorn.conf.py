@@ -0,0 +1,32 @@
+"""
+Gunicorn settings for serving the Flask API in production.
+
+Usage:
+    gunicorn -c gunicorn.conf.py api.app:app
+
+Async job state (JOB_STORE, IMAGE_JOB_STORE, LECTURE_JOB_STORE) lives in the
+worker process, so status polling only works when every request reaches the
+same worker. Keep WEB_CONCURRENCY at 1 and scale with threads instead; the
+heavy stages (MFA container, ASR service) run out-of-process anyway.
+"""
+import os
+
+
+def _env_int(name, default, minimum=1):
+    try:
+        return max(minimum, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+bind = os.environ.get("PTE_BIND", "0.0.0.0:5000")
+workers = _env_int("WEB_CONCURRENCY", 1)
+worker_class = "gthread"
+threads = _env_int("PTE_GUNICORN_THREADS", min(32, (os.cpu_count() or 1) * 4))
+# Load models/reference data once in the master and share pages with forked workers.
+preload_app = True
+# MFA alignment via /check_stream can run 60-90s per request.
+timeout = _env_int("PTE_GUNICORN_TIMEOUT", 180)
+keepalive = 5
+accesslog = None
+errorlog = "-"
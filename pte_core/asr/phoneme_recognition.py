@@ -1,5 +1,4 @@
-import requests
-from src.shared.services import PHONEME_SERVICE_URL
+from src.shared.services import PHONEME_SERVICE_URL, get_service_session
 
 def call_phoneme_service(wav_path, start=None, end=None):
     """
@@ -17,7 +16,7 @@ def call_phoneme_service(wav_path, start=None, end=None):
             if end is not None:
                 data["end"] = end
                 
-            r = requests.post(
+            r = get_service_session().post(
                 PHONEME_SERVICE_URL,
                 files={"audio": f},
                 data=data,
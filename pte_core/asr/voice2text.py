@@ -1,7 +1,128 @@
-import requests
+import io
 import os
+import copy
+import hashlib
+import threading
+import wave
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 from .pseudo_voice2text import voice2text_word, voice2text_char, voice2text_segment
-from src.shared.services import ASR_SERVICE_URL
+from src.shared.services import ASR_SERVICE_URL, get_service_session
+
+
+def _asr_cache_size():
+    """Max cached transcriptions (PTE_ASR_CACHE_SIZE, 0 disables)."""
+    try:
+        return max(0, int(os.environ.get("PTE_ASR_CACHE_SIZE", "256")))
+    except ValueError:
+        return 256
+
+
+# Transcriptions keyed by blake2b digest of the audio bytes, so re-submitted
+# recordings (retries, page reloads) skip the ASR round-trip entirely.
+_ASR_CACHE = OrderedDict()
+_ASR_CACHE_LOCK = threading.Lock()
+
+
+def _audio_digest(file_path):
+    hasher = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _cache_get(digest):
+    with _ASR_CACHE_LOCK:
+        cached = _ASR_CACHE.get(digest)
+        if cached is None:
+            return None
+        _ASR_CACHE.move_to_end(digest)
+        return copy.deepcopy(cached)
+
+
+def _cache_put(digest, result, max_size):
+    with _ASR_CACHE_LOCK:
+        _ASR_CACHE[digest] = copy.deepcopy(result)
+        _ASR_CACHE.move_to_end(digest)
+        while len(_ASR_CACHE) > max_size:
+            _ASR_CACHE.popitem(last=False)
+
+
+def _asr_chunk_seconds():
+    """Target chunk length for splitting long recordings (PTE_ASR_CHUNK_SECONDS, 0 disables)."""
+    try:
+        return max(0.0, float(os.environ.get("PTE_ASR_CHUNK_SECONDS", "0")))
+    except ValueError:
+        return 0.0
+
+
+def _split_wav_on_pauses(file_path, chunk_seconds, search_seconds=5.0, frame_seconds=0.02):
+    """
+    Split a 16-bit mono WAV into ~chunk_seconds pieces, cutting at the quietest
+    frame within search_seconds before each boundary so words are not split.
+    Returns [(offset_seconds, wav_bytes), ...], or None for other sample formats.
+    """
+    with wave.open(file_path, 'rb') as wav_in:
+        if wav_in.getnchannels() != 1 or wav_in.getsampwidth() != 2:
+            return None
+        rate = wav_in.getframerate()
+        samples = np.frombuffer(wav_in.readframes(wav_in.getnframes()), dtype='<i2')
+
+    chunk_len = int(chunk_seconds * rate)
+    frame_len = max(1, int(frame_seconds * rate))
+    if chunk_len <= 2 * frame_len or len(samples) <= chunk_len:
+        return None
+    frame_count = len(samples) // frame_len
+    energy = np.square(samples[:frame_count * frame_len].astype(np.float32)).reshape(frame_count, frame_len).sum(axis=1)
+
+    cuts = [0]
+    while len(samples) - cuts[-1] > chunk_len:
+        target_frame = (cuts[-1] + chunk_len) // frame_len
+        first_frame = max(cuts[-1] // frame_len + 1, target_frame - int(search_seconds / frame_seconds))
+        cuts.append((first_frame + int(np.argmin(energy[first_frame:target_frame + 1]))) * frame_len)
+    cuts.append(len(samples))
+
+    chunks = []
+    for start, end in zip(cuts, cuts[1:]):
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav_out:
+            wav_out.setnchannels(1)
+            wav_out.setsampwidth(2)
+            wav_out.setframerate(rate)
+            wav_out.writeframes(samples[start:end].tobytes())
+        chunks.append((start / rate, buffer.getvalue()))
+    return chunks
+
+
+def _post_audio(audio):
+    """POST one recording (file object or WAV bytes) to the ASR service; returns its JSON."""
+    response = get_service_session().post(ASR_SERVICE_URL, files={'file': audio}, timeout=60)
+    response.raise_for_status()
+    return response.json()
+
+
+def _transcribe_chunks(chunks, max_workers=4):
+    """Transcribe WAV chunks concurrently and merge them into one service-style result."""
+    def transcribe(chunk):
+        offset, data = chunk
+        result = _post_audio(('chunk.wav', data, 'audio/wav'))
+        words = [
+            dict(w, start=w.get("start", 0.0) + offset, end=w.get("end", 0.0) + offset)
+            for w in result.get("word_timestamps", [])
+        ]
+        return result.get("text", "").strip(), words
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(chunks), max_workers)), thread_name_prefix="pte-asr") as executor:
+        parts = list(executor.map(transcribe, chunks))
+    return {
+        "text": " ".join(text for text, _ in parts if text),
+        "word_timestamps": [w for _, words in parts for w in words],
+    }
+
 
 def voice2text(file_path):
     """
@@ -16,36 +137,55 @@ def voice2text(file_path):
             'segment_timestamps': []
         }
 
+    cache_size = _asr_cache_size()
+    digest = None
+    if cache_size:
+        try:
+            digest = _audio_digest(file_path)
+            cached = _cache_get(digest)
+            if cached is not None:
+                return cached
+        except OSError:
+            digest = None
+
     try:
-        with open(file_path, 'rb') as f:
-            files = {'file': f}
-            response = requests.post(ASR_SERVICE_URL, files=files, timeout=60)
-            response.raise_for_status()
-            result = response.json()
-            
-            # The ASR service now returns {"text": "...", "word_timestamps": [...]}
-            full_text = result.get("text", "")
-            word_ts = result.get("word_timestamps", [])
-            
-            # Transform word_timestamps to the internal format if needed
-            # ASR service returns: {"word": "...", "start": 0.0, "end": 0.0}
-            # Internal format expects: {"value": "...", "start": 0.0, "end": 0.0}
-            formatted_word_ts = []
-            for w in word_ts:
-                formatted_word_ts.append({
-                    "value": w.get("word", ""),
-                    "start": w.get("start", 0.0),
-                    "end": w.get("end", 0.0)
-                })
-
-            return {
-                'text': full_text,
-                'word_timestamps': formatted_word_ts,
-                'char_timestamps': [], 
-                'segment_timestamps': [{'start': word_ts[0]['start'] if word_ts else 0, 
-                                       'end': word_ts[-1]['end'] if word_ts else 0, 
-                                       'value': full_text}] if full_text else []
-            }
+        # Long recordings go out as pause-aligned chunks transcribed in parallel.
+        chunk_seconds = _asr_chunk_seconds()
+        chunks = None
+        if chunk_seconds:
+            try:
+                chunks = _split_wav_on_pauses(file_path, chunk_seconds)
+            except (wave.Error, EOFError):
+                chunks = None
+        if chunks:
+            result = _transcribe_chunks(chunks)
+        else:
+            with open(file_path, 'rb') as f:
+                result = _post_audio(f)
+
+        # The ASR service now returns {"text": "...", "word_timestamps": [...]}
+        full_text = result.get("text", "")
+        word_ts = result.get("word_timestamps", [])
+
+        # Transform word_timestamps to the internal format if needed
+        # ASR service returns: {"word": "...", "start": 0.0, "end": 0.0}
+        # Internal format expects: {"value": "...", "start": 0.0, "end": 0.0}
+        formatted_word_ts = [
+            {"value": w.get("word", ""), "start": w.get("start", 0.0), "end": w.get("end", 0.0)}
+            for w in word_ts
+        ]
+
+        transcription = {
+            'text': full_text,
+            'word_timestamps': formatted_word_ts,
+            'char_timestamps': [], 
+            'segment_timestamps': [{'start': word_ts[0]['start'] if word_ts else 0, 
+                                   'end': word_ts[-1]['end'] if word_ts else 0, 
+                                   'value': full_text}] if full_text else []
+        }
+        if digest:
+            _cache_put(digest, transcription, cache_size)
+        return transcription
     except Exception as e:
         print(f"ASR Service error: {e}")
         # Fallback to pseudo data for now if service fails, to keep system running
@@ -58,6 +198,20 @@ def voice2text(file_path):
         }
 
 
+def voice2text_batch(file_paths, max_workers=4):
+    """
+    Transcribe several recordings, returning voice2text results in input order.
+    The ASR service takes one file per request, so the requests run concurrently
+    over the pooled keep-alive session; repeated recordings hit the transcription cache.
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) <= 1:
+        return [voice2text(path) for path in file_paths]
+    workers = max(1, min(len(file_paths), max_workers))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pte-asr") as executor:
+        return list(executor.map(voice2text, file_paths))
+
+
 def words_timestamps(file_path):
     """
     Returns word-level timestamps in format: {start: , end: , word: }
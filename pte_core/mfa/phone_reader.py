@@ -9,6 +9,9 @@ try:
 except ImportError:
     textgrid = None  # type: ignore
 
+# Silence / short-pause labels MFA writes into the phone tier.
+_SILENCE_LABELS = frozenset(("sp", "sil"))
+
 
 def read_phone_textgrid(path: str) -> List[Dict[str, Any]]:
     """Read phone-level TextGrid and return list of phone alignments.
@@ -49,12 +52,13 @@ def read_phone_textgrid(path: str) -> List[Dict[str, Any]]:
         return phones
 
     for interval in phone_tier:
-        if interval.mark.strip() and interval.mark.strip() not in ("", "sp", "sil"):
+        label = interval.mark.strip()
+        if label and label not in _SILENCE_LABELS:
             start = float(interval.minTime)
             end = float(interval.maxTime)
             phones.append(
                 {
-                    "label": interval.mark.strip(),
+                    "label": label,
                     "start": start,
                     "end": end,
                     "duration": end - start,
@@ -90,7 +94,7 @@ def read_phone_json(path: str) -> List[Dict[str, Any]]:
             if tier.get("name", "").lower() in ("phones", "phone", "phonemes", "phoneme"):
                 for interval in tier.get("intervals", []):
                     label = interval.get("mark", "").strip()
-                    if label and label not in ("", "sp", "sil"):
+                    if label and label not in _SILENCE_LABELS:
                         start = float(interval.get("minTime", 0))
                         end = float(interval.get("maxTime", 0))
                         phones.append(
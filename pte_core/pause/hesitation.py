@@ -28,43 +28,45 @@ def apply_hesitation_clustering(
     
     # Create a copy to avoid modifying original
     results = [r.copy() for r in pause_results]
-    
-    # Sort by start time to process chronologically
-    sorted_results = sorted(results, key=lambda x: x.get("start", 0) or 0)
-    
+
+    # Pull the timing fields into parallel lists once instead of re-reading dicts per comparison
+    starts = [r.get("start", 0) or 0 for r in results]
+    ends = [r.get("end") or start for r, start in zip(results, starts)]
+
+    # Process chronologically (stable, like sorting the records by start)
+    order = sorted(range(len(results)), key=starts.__getitem__)
+
     # Identify clusters: group pauses that are within window of each other
     clusters = []
-    current_cluster = [0]  # Start with first pause
-    
-    for i in range(1, len(sorted_results)):
-        prev_pause_end = sorted_results[i - 1].get("end") or sorted_results[i - 1].get("start", 0) or 0
-        curr_pause_start = sorted_results[i].get("start", 0) or 0
-        time_gap = curr_pause_start - prev_pause_end
-        
+    current_cluster = [order[0]]  # Start with first pause
+
+    for prev_idx, curr_idx in zip(order, order[1:]):
+        time_gap = starts[curr_idx] - ends[prev_idx]
+
         if time_gap <= window and time_gap >= 0:
             # Add to current cluster
-            current_cluster.append(i)
+            current_cluster.append(curr_idx)
         else:
             # Start new cluster
             if len(current_cluster) > 1:
                 clusters.append(current_cluster)
-            current_cluster = [i]
-    
+            current_cluster = [curr_idx]
+
     # Add last cluster if it has multiple pauses
     if len(current_cluster) > 1:
         clusters.append(current_cluster)
-    
+
     # Amplify penalties for all pauses in clusters
     for cluster in clusters:
         cluster_size = len(cluster)
         # Each additional pause in cluster adds 20% penalty amplification
         amplification = 1.0 + 0.2 * (cluster_size - 1)
         for idx in cluster:
-            sorted_results[idx]["penalty"] = min(
-                sorted_results[idx].get("penalty", 0.0) * amplification, 1.0
+            results[idx]["penalty"] = min(
+                results[idx].get("penalty", 0.0) * amplification, 1.0
             )
-            sorted_results[idx]["cluster_size"] = cluster_size
-    
+            results[idx]["cluster_size"] = cluster_size
+
     return results
 
 
@@ -87,11 +89,8 @@ def aggregate_pause_penalty(
     if not pause_results:
         return 0.0
     
-    # Extract penalties
-    penalties = [p.get("penalty", 0.0) for p in pause_results]
-    
     # Calculate mean penalty (normalized by count)
-    mean_penalty = sum(penalties) / len(penalties)
+    mean_penalty = sum(p.get("penalty", 0.0) for p in pause_results) / len(pause_results)
     
     # Cap at maximum contribution
     final_penalty = min(mean_penalty, max_penalty)
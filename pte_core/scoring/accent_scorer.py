@@ -31,6 +31,8 @@ class PhonemeNormalizer:
         'DX': 'ɾ'  # Flap T
     }
 
+    _STRESS_DIGITS_TABLE = str.maketrans('', '', '0123456789')
+
     def normalize(self, phoneme: str) -> str:
         """
         Convert ARPAbet phoneme (potentially with stress) to IPA.
@@ -46,7 +48,7 @@ class PhonemeNormalizer:
             return self.SPECIAL_CASES[p]
             
         # Strip stress digits for general mapping
-        base = ''.join([c for c in p if not c.isdigit()])
+        base = p.translate(self._STRESS_DIGITS_TABLE)
         
         return self.ARPABET_TO_IPA.get(base, base.lower())
 
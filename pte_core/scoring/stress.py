@@ -1,3 +1,4 @@
+import functools
 import numpy as np
 import librosa
 import re
@@ -37,8 +38,11 @@ def _normalize_phone_token(token):
     return t
 
 
+_STRESS_DIGITS_RE = re.compile(r'\d+')
+
+
 def _is_arpa_vowel(phone):
-    base = re.sub(r'\d+', '', str(phone or "").upper())
+    base = _STRESS_DIGITS_RE.sub('', str(phone or "").upper())
     return base in ARPA_VOWELS
 
 
@@ -51,7 +55,9 @@ def _is_ipa_vowel(phone):
     return any(ch in IPA_VOWEL_CHARS for ch in p)
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_vowel_phone(phone):
+    # Called per phone of every scored word; phone inventories are small, so nearly every call is a hit.
     return _is_arpa_vowel(phone) or _is_ipa_vowel(phone)
 
 def get_syllable_stress_details(audio_path, start_time, end_time, phonemes_with_times, reference_stress_pattern):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import threading
 
 
 def _normalize_base_url(url: str) -> str:
@@ -26,3 +27,26 @@ MFA_DOCKER_IMAGE = os.environ.get(
     "mmcauliffe/montreal-forced-aligner:latest",
 )
 
+
+_SERVICE_SESSION = None
+_SERVICE_SESSION_LOCK = threading.Lock()
+
+
+def get_service_session():
+    """
+    Shared keep-alive requests.Session for calls to the ASR, grammar and phoneme
+    services, so each job reuses pooled connections instead of opening new sockets.
+    """
+    global _SERVICE_SESSION
+    if _SERVICE_SESSION is None:
+        with _SERVICE_SESSION_LOCK:
+            if _SERVICE_SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SERVICE_SESSION = session
+    return _SERVICE_SESSION
@@ -1,4 +1,8 @@
+import atexit
+import os
+import shutil
 import sys
+import tempfile
 import types
 from pathlib import Path
 
@@ -9,6 +13,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# Attempt artifacts are persisted under USER_UPLOADS_DIR, which is resolved at
+# import time, so point it at a throwaway dir before any api module loads.
+if "PTE_USER_UPLOADS_DIR" not in os.environ:
+    _TEST_UPLOADS_DIR = tempfile.mkdtemp(prefix="pte-test-uploads-")
+    os.environ["PTE_USER_UPLOADS_DIR"] = _TEST_UPLOADS_DIR
+    atexit.register(shutil.rmtree, _TEST_UPLOADS_DIR, True)
+
 
 def _install_panphon_stub_if_needed():
     try:
@@ -1,5 +1,9 @@
 import io
 import json
+import threading
+import time
+
+import pytest
 
 import api.app as app_module
 import api.validator as validator_module
@@ -74,15 +78,37 @@ def test_grammar_proxy_contract(client, monkeypatch):
         assert timeout == 10
         return DummyResponse()
 
-    monkeypatch.setattr(app_module.requests, "post", fake_post)
+    monkeypatch.setattr(app_module.GRAMMAR_SESSION, "post", fake_post)
 
     response = client.post("/api/grammar", json={"text": "hello world"})
     assert response.status_code == 200
     assert response.get_json() == {"matches": ["ok"]}
 
 
+def test_grammar_proxy_caches_identical_payloads(client, monkeypatch):
+    calls = []
+
+    class DummyResponse:
+        status_code = 200
+        text = json.dumps({"matches": []})
+        headers = {"Content-Type": "application/json"}
+
+    def fake_post(url, json, timeout):  # noqa: A002 - mirror requests.post signature
+        calls.append(json)
+        return DummyResponse()
+
+    monkeypatch.setattr(app_module, "GRAMMAR_RESPONSE_CACHE", app_module.OrderedDict())
+    monkeypatch.setattr(app_module.GRAMMAR_SESSION, "post", fake_post)
+
+    for _ in range(2):
+        response = client.post("/api/grammar", json={"text": "cache me"})
+        assert response.status_code == 200
+        assert response.get_json() == {"matches": []}
+    assert len(calls) == 1
+
+
 def test_check_stream_ndjson_contract(client, monkeypatch):
-    def fake_convert_to_wav(_input_path, _output_path):
+    def fake_convert_stream_to_wav(_in_stream, _output_path):
         return True
 
     def fake_align_and_validate_gen(_audio_path, _text_path, accents=None):
@@ -95,7 +121,7 @@ def test_check_stream_ndjson_contract(client, monkeypatch):
             },
         }
 
-    monkeypatch.setattr(app_module, "convert_to_wav", fake_convert_to_wav)
+    monkeypatch.setattr(app_module, "convert_stream_to_wav", fake_convert_stream_to_wav)
     monkeypatch.setattr(validator_module, "align_and_validate_gen", fake_align_and_validate_gen)
 
     data = {
@@ -788,3 +814,163 @@ def test_write_email_score_contract(client):
     assert "analysis" in data
     assert "feedback" in data
     assert isinstance(data["feedback"], list)
+
+
+def test_word_practice_cleans_scratch_dir(client, monkeypatch, tmp_path):
+    class DummyBuilder:
+        def word_to_phonemes(self, _word):
+            return ["HH", "AH", "L", "OW"]
+
+    class DummyScorer:
+        def score_word(self, expected, _observed, _accent):
+            return {"accuracy": 90.0, "alignment": [(phone, phone, 1.0) for phone in expected]}
+
+    monkeypatch.setattr(app_module, "SCRATCH_DIR", str(tmp_path))
+    monkeypatch.setattr(app_module, "convert_stream_to_wav", lambda _stream, _dst: False)
+    monkeypatch.setattr(app_module, "_get_word_practice_builder", lambda: DummyBuilder())
+    monkeypatch.setattr(app_module, "_get_word_practice_scorer", lambda: DummyScorer())
+    monkeypatch.setattr(app_module, "call_phoneme_service", lambda _path: ["HH", "AH", "L", "OW"])
+
+    data = {"audio": (io.BytesIO(b"RIFFFAKEAUDIO"), "word.webm"), "word": "hello"}
+    response = client.post("/api/word-practice", data=data, content_type="multipart/form-data")
+
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "correct"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_buffered_ndjson_coalesces_progress_bursts():
+    updates = [
+        {"type": "progress", "percent": 10},
+        {"type": "progress", "percent": 15},
+        {"type": "progress", "percent": 20},
+        {"type": "result", "data": {"ok": True}},
+    ]
+
+    chunks = list(app_module._buffered_ndjson(iter(updates), max_delay=60))
+    events = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    assert len(chunks) == 2
+    assert [event.get("percent") for event in events] == [10, 20, None]
+    assert events[-1]["type"] == "result"
+
+
+def test_buffered_ndjson_flushes_new_stage_immediately():
+    updates = iter([
+        {"type": "progress", "percent": 25, "message": "Checking pronunciation..."},
+        {"type": "progress", "percent": 30, "message": "Running MFA alignment..."},
+    ])
+    chunks = app_module._buffered_ndjson(updates, max_delay=60)
+
+    assert json.loads(next(chunks))["percent"] == 25
+    # Yielded before the generator asks for another update.
+    assert json.loads(next(chunks))["message"] == "Running MFA alignment..."
+
+
+def test_check_status_sends_content_length(client, monkeypatch):
+    monkeypatch.setattr(app_module, "JOB_STORE", app_module.ShardedJobStore())
+    app_module.JOB_STORE.create("job12345", {"status": "complete", "result": {"score": 1}})
+
+    response = client.get("/check/status/job12345")
+    assert response.status_code == 200
+    assert "Transfer-Encoding" not in response.headers
+    assert int(response.headers["Content-Length"]) == len(response.get_data())
+    assert response.get_json() == {"job_id": "job12345", "status": "complete", "result": {"score": 1}}
+
+
+def test_serve_image_supports_conditional_requests(client, monkeypatch, tmp_path):
+    (tmp_path / "chart.png").write_bytes(b"\x89PNG fake image bytes")
+    monkeypatch.setattr(app_module, "IMAGES_DIR", str(tmp_path))
+
+    response = client.get("/images/chart.png")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=86400"
+    etag = response.headers["ETag"]
+    response.close()
+
+    cached = client.get("/images/chart.png", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_serve_image_offloads_to_nginx_when_accel_prefix_set(client, monkeypatch, tmp_path):
+    (tmp_path / "chart.png").write_bytes(b"\x89PNG fake image bytes")
+    monkeypatch.setattr(app_module, "IMAGES_DIR", str(tmp_path))
+    monkeypatch.setattr(app_module, "STATIC_ACCEL_PREFIX", "/_protected")
+
+    response = client.get("/images/chart.png")
+    assert response.status_code == 200
+    assert response.headers["X-Accel-Redirect"] == "/_protected/images/chart.png"
+    assert response.mimetype == "image/png"
+    assert response.get_data() == b""
+
+    assert client.get("/images/missing.png").status_code == 404
+    assert client.get("/images/../secret.txt").status_code == 404
+
+
+def test_describe_image_submit_rejects_when_pool_backlog_full(client, monkeypatch):
+    monkeypatch.setitem(app_module._JOB_POOL_LIMITS, "image", 0)
+    monkeypatch.setattr(app_module, "convert_stream_to_wav", lambda *_args: pytest.fail("should reject before converting"))
+
+    data = {"audio": (io.BytesIO(b"RIFFFAKEAUDIO"), "answer.webm"), "image_id": "1"}
+    response = client.post("/describe-image/submit", data=data, content_type="multipart/form-data")
+
+    assert response.status_code == 503
+    assert "error" in response.get_json()
+
+
+def test_submit_job_tracks_pending_until_done():
+    assert app_module._reserve_job_slot("lecture") is True
+    assert app_module._submit_job("lecture", lambda: None).result(timeout=5) is None
+    deadline = time.monotonic() + 2
+    while app_module._JOB_POOL_PENDING["lecture"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert app_module._JOB_POOL_PENDING["lecture"] == 0
+
+
+def test_reserve_job_slot_never_overshoots_limit(monkeypatch):
+    monkeypatch.setitem(app_module._JOB_POOL_LIMITS, "image", 3)
+    monkeypatch.setitem(app_module._JOB_POOL_PENDING, "image", 0)
+    barrier = threading.Barrier(8)
+
+    def reserve():
+        barrier.wait()
+        return app_module._reserve_job_slot("image")
+
+    threads_results = []
+    workers = [threading.Thread(target=lambda: threads_results.append(reserve())) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert threads_results.count(True) == 3
+    assert app_module._JOB_POOL_PENDING["image"] == 3
+
+
+def test_describe_image_submit_releases_slot_when_conversion_fails(client, monkeypatch):
+    monkeypatch.setitem(app_module._JOB_POOL_PENDING, "image", 0)
+    monkeypatch.setattr(app_module, "convert_stream_to_wav", lambda *_args: False)
+
+    data = {"audio": (io.BytesIO(b"RIFFFAKEAUDIO"), "answer.webm"), "image_id": "1"}
+    response = client.post("/describe-image/submit", data=data, content_type="multipart/form-data")
+
+    assert response.status_code == 500
+    assert app_module._JOB_POOL_PENDING["image"] == 0
+
+
+def test_describe_image_submit_fails_record_when_pool_rejects_job(client, monkeypatch):
+    monkeypatch.setitem(app_module._JOB_POOL_PENDING, "image", 0)
+    monkeypatch.setattr(app_module, "convert_stream_to_wav", lambda *_args: True)
+    monkeypatch.setattr(app_module, "new_job_id", lambda: "job-rejected")
+
+    def reject(*_args):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(app_module.JOB_POOLS["image"], "submit", reject)
+
+    data = {"audio": (io.BytesIO(b"RIFFFAKEAUDIO"), "answer.webm"), "image_id": "1"}
+    response = client.post("/describe-image/submit", data=data, content_type="multipart/form-data")
+
+    assert response.status_code == 500
+    assert app_module.IMAGE_JOB_STORE.get("job-rejected")["status"] == "failed"
+    assert app_module._JOB_POOL_PENDING["image"] == 0
@@ -1,4 +1,5 @@
 import json
+import time
 from pathlib import Path
 
 import api.app as app_module
@@ -87,3 +88,17 @@ def test_cleanup_force_removes_temp_files(tmp_path, monkeypatch):
 
     app_module._maybe_cleanup([str(temp_file)], force=True)
     assert not temp_file.exists()
+
+
+
+def test_background_cleanup_is_reaped_off_thread(tmp_path, monkeypatch):
+    temp_file = tmp_path / "read_aloud_attempt.wav"
+    temp_file.write_bytes(b"RIFF")
+    monkeypatch.setattr(app_module, "KEEP_UPLOAD_ARTIFACTS", False)
+
+    app_module._maybe_cleanup([str(temp_file), str(tmp_path / "missing.txt")], background=True)
+
+    deadline = time.monotonic() + 2
+    while temp_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not temp_file.exists()
@@ -0,0 +1,72 @@
+import wave
+
+import numpy as np
+import pytest
+
+import api.app as app_module
+
+
+def _write_stereo_wav(path, sample_rate=44100, seconds=0.5):
+    samples = int(sample_rate * seconds)
+    t = np.linspace(0, seconds, samples, endpoint=False)
+    tone = (np.sin(2 * np.pi * 440 * t) * 0.3 * 32767).astype("<i2")
+    stereo = np.stack([tone, tone], axis=1)
+    with wave.open(str(path), "wb") as out_file:
+        out_file.setnchannels(2)
+        out_file.setsampwidth(2)
+        out_file.setframerate(sample_rate)
+        out_file.writeframes(stereo.tobytes())
+
+
+def test_convert_to_wav_inprocess_resamples_to_16k_mono(tmp_path):
+    pytest.importorskip("av")
+    source = tmp_path / "upload.wav"
+    target = tmp_path / "converted.wav"
+    _write_stereo_wav(source)
+
+    assert app_module.convert_to_wav(str(source), str(target)) is True
+
+    with wave.open(str(target), "rb") as converted:
+        assert converted.getnchannels() == 1
+        assert converted.getframerate() == 16000
+        assert converted.getsampwidth() == 2
+        assert abs(converted.getnframes() - 8000) <= 160
+
+
+def test_convert_stream_to_wav_reads_upload_stream(tmp_path):
+    pytest.importorskip("av")
+    source = tmp_path / "upload.wav"
+    target = tmp_path / "converted.wav"
+    _write_stereo_wav(source)
+
+    with open(source, "rb") as upload_stream:
+        assert app_module.convert_stream_to_wav(upload_stream, str(target)) is True
+
+    with wave.open(str(target), "rb") as converted:
+        assert converted.getnchannels() == 1
+        assert converted.getframerate() == 16000
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["converted.wav", "upload.wav"]
+
+
+def test_convert_stream_to_wav_keeps_16k_mono_upload_as_is(tmp_path, monkeypatch):
+    source = tmp_path / "upload.wav"
+    target = tmp_path / "converted.wav"
+    with wave.open(str(source), "wb") as mono:
+        mono.setnchannels(1)
+        mono.setsampwidth(2)
+        mono.setframerate(16000)
+        mono.writeframes(np.zeros(8000, dtype="<i2").tobytes())
+    monkeypatch.setattr(app_module, "PYAV_AVAILABLE", False)
+
+    with open(source, "rb") as upload_stream:
+        assert app_module.convert_stream_to_wav(upload_stream, str(target)) is True
+
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_is_already_target_wav_rejects_other_formats(tmp_path):
+    source = tmp_path / "stereo.wav"
+    _write_stereo_wav(source, sample_rate=16000)
+
+    assert app_module._is_already_target_wav(source.read_bytes()[:44]) is False
+    assert app_module._is_already_target_wav(b"RIFF") is False
@@ -1,3 +1,6 @@
+import json
+import os
+
 import api.image_evaluator as image_evaluator
 
 
@@ -65,3 +68,72 @@ def test_calculate_score_duration_affects_fluency():
 
     assert details_good["fluency_score"] > details_short["fluency_score"]
     assert score_good >= score_short
+
+
+def test_image_reference_cache_reloads_when_file_changes(monkeypatch, tmp_path):
+    reference_file = tmp_path / "images.json"
+    reference_file.write_text(json.dumps({"images": [{"id": "img1", "title": "First"}]}), encoding="utf-8")
+    monkeypatch.setattr(image_evaluator, "REFERENCES_FILE", reference_file)
+
+    assert image_evaluator.get_image_by_id("img1")["title"] == "First"
+    assert image_evaluator.load_image_data() is image_evaluator.load_image_data()
+
+    reference_file.write_text(json.dumps({"images": [{"id": "img2", "title": "Second"}]}), encoding="utf-8")
+    os.utime(reference_file, ns=(1, reference_file.stat().st_mtime_ns + 1_000_000))
+
+    assert image_evaluator.get_image_by_id("img1") is None
+    assert image_evaluator.get_image_by_id("img2")["title"] == "Second"
+
+
+def test_image_reference_cache_precomputes_lowercase_keywords(monkeypatch, tmp_path):
+    reference_file = tmp_path / "images.json"
+    reference_file.write_text(
+        json.dumps({"images": [{"id": "img1", "keywords": ["Bar Chart", "Sales"]}]}), encoding="utf-8"
+    )
+    monkeypatch.setattr(image_evaluator, "REFERENCES_FILE", reference_file)
+
+    keywords_lower = image_evaluator._image_data_and_index()[2]["img1"]
+
+    assert keywords_lower == ("bar chart", "sales")
+    assert image_evaluator._missing_keywords_in_lower(
+        ["Bar Chart", "Sales"], "the bar chart rises", keywords_lower
+    ) == ["Sales"]
+
+
+def test_feedback_reuses_missing_keywords_from_scoring():
+    reference = "The bar chart shows quarterly sales from Q1 to Q4 with an increasing trend."
+    keywords = ["bar chart", "quarterly", "sales", "revenue", "profit", "margin"]
+    student = "The bar chart shows sales for each quarter. Overall, the numbers rise steadily over the year."
+
+    score, details = image_evaluator.calculate_score(reference, student, keywords, speech_duration_seconds=30)
+
+    assert details["missing_keywords"] == ["quarterly", "revenue", "profit"]
+    assert details["keyword_coverage"] == 33.3
+    feedback = image_evaluator.generate_feedback(score, details, keywords, student)
+    assert "Try to use key words: quarterly, revenue, profit." in feedback
+
+
+def test_evaluate_description_reuses_cached_result(monkeypatch, tmp_path):
+    reference_file = tmp_path / "images.json"
+    reference_file.write_text(
+        json.dumps({"images": [{"id": "img1", "title": "Sales", "reference": "Sales rise.", "keywords": ["sales"]}]}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(image_evaluator, "REFERENCES_FILE", reference_file)
+    monkeypatch.setattr(image_evaluator, "_EVALUATION_CACHE", image_evaluator.OrderedDict())
+    calls = []
+
+    def fake_calculate_score(reference, student_text, keywords, **kwargs):
+        calls.append(student_text)
+        return 42, {"content_gate": {"active": False}}
+
+    monkeypatch.setattr(image_evaluator, "calculate_score", fake_calculate_score)
+
+    first = image_evaluator.evaluate_description("img1", "The sales rise every quarter.", speech_duration_seconds=30)
+    first["details"]["mutated"] = True
+    second = image_evaluator.evaluate_description("img1", "The sales rise every quarter.", speech_duration_seconds=30)
+    image_evaluator.evaluate_description("img1", "A different answer about sales.", speech_duration_seconds=30)
+
+    assert second["score"] == 42
+    assert "mutated" not in second["details"]
+    assert calls == ["The sales rise every quarter.", "A different answer about sales."]
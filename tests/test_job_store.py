@@ -0,0 +1,80 @@
+import threading
+
+from api.job_store import ShardedJobStore, new_job_id
+
+
+def test_complete_writes_status_and_result_together():
+    store = ShardedJobStore(shards=4)
+    store.create("job1", {"status": "queued", "result": None, "error": None})
+
+    assert store.complete("job1", {"score": 90}) is True
+
+    job = store.get("job1")
+    assert job["status"] == "complete"
+    assert job["result"] == {"score": 90}
+
+
+def test_get_returns_snapshot_and_unknown_jobs_are_none():
+    store = ShardedJobStore()
+    store.create("job1", {"status": "queued"})
+
+    snapshot = store.get("job1")
+    snapshot["status"] = "mutated"
+
+    assert store.get("job1")["status"] == "queued"
+    assert store.get("missing") is None
+    assert store.fail("missing", "boom") is False
+    assert "job1" in store and "missing" not in store
+
+
+def test_create_evicts_oldest_finished_jobs_only():
+    store = ShardedJobStore(shards=1, max_entries=2)
+    store.create("running", {"status": "processing"})
+    store.create("done", {"status": "complete"})
+    store.create("new", {"status": "queued"})
+
+    assert "running" in store
+    assert "done" not in store
+    assert "new" in store
+    assert len(store) == 2
+
+
+def test_concurrent_updates_across_shards():
+    store = ShardedJobStore(shards=8, max_entries=10_000)
+    job_ids = [f"job{idx}" for idx in range(200)]
+    for job_id in job_ids:
+        store.create(job_id, {"status": "queued"})
+
+    def worker(ids):
+        for job_id in ids:
+            store.set_status(job_id, "processing")
+            store.complete(job_id, job_id)
+
+    threads = [threading.Thread(target=worker, args=(job_ids[idx::4],)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(store.get(job_id)["result"] == job_id for job_id in job_ids)
+
+
+def test_sweep_drops_only_expired_finished_jobs():
+    store = ShardedJobStore(shards=2)
+    store.create("old", {"status": "queued"})
+    store.create("running", {"status": "processing"})
+    store.complete("old", {"score": 1})
+    store.create("fresh", {"status": "queued"})
+    store.fail("fresh", "boom")
+
+    finished_at = store.get("old")["finished_at"]
+    assert store.sweep(60, now=finished_at + 61) == 2
+    assert "old" not in store and "fresh" not in store
+    assert "running" in store
+    assert store.sweep(60) == 0
+
+
+def test_new_job_id_is_unique_and_fixed_width():
+    ids = [new_job_id() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert all(len(job_id) == 12 for job_id in ids)
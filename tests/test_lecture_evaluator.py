@@ -1,3 +1,5 @@
+import pytest
+
 import api.lecture_evaluator as lecture_module
 
 
@@ -81,3 +83,36 @@ def test_calculate_score_applies_short_content_gate(monkeypatch):
     assert score == 0
     assert details["content_gate"]["active"] is True
     assert details["content_gate"]["code"] == "too_short"
+
+
+def test_tfidf_similarity_matches_two_document_vectorizer():
+    sklearn_text = pytest.importorskip("sklearn.feature_extraction.text")
+    sklearn_pairwise = pytest.importorskip("sklearn.metrics.pairwise")
+    reference = "The printing press enabled mass production of books and spread ideas across Europe."
+    student = "The lecture says the printing press spread ideas, and books became cheaper to produce."
+
+    matrix = sklearn_text.TfidfVectorizer().fit_transform([reference, student])
+    expected = sklearn_pairwise.cosine_similarity(matrix[0:1], matrix[1:2])[0][0]
+
+    assert lecture_module.tfidf_similarity(reference, student) == pytest.approx(expected)
+    assert lecture_module.tfidf_similarity(reference, "") == 0.0
+
+
+def test_preprocess_text_strips_punctuation_after_collapsing_whitespace():
+    assert lecture_module.preprocess_text("The  Lecture's\tpoint - 45%!") == "the lectures point  45"
+    assert lecture_module.preprocess_text("Café  naïve, résumé!") == "caf nave rsum"
+
+
+def test_evaluate_lectures_batch_preserves_input_order(monkeypatch):
+    monkeypatch.setattr(lecture_module, "get_semantic_model", lambda: None)
+
+    lecture_ids = [lecture["id"] for lecture in lecture_module.load_lecture_data()["lectures"][:3]]
+    items = [(lecture_id, "The lecture explains the main idea and its consequences.") for lecture_id in lecture_ids]
+    items.append(("missing-lecture", "anything"))
+
+    results = lecture_module.evaluate_lectures_batch(items, max_workers=2)
+
+    expected = [lecture_module.evaluate_lecture(*item) for item in items]
+    assert [result.get("score") for result in results] == [result.get("score") for result in expected]
+    assert [result.get("lecture_title") for result in results] == [result.get("lecture_title") for result in expected]
+    assert results[-1]["error"] == "Lecture not found"
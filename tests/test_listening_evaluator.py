@@ -1,3 +1,5 @@
+import pytest
+
 import api.listening_evaluator as listening_module
 
 
@@ -103,3 +105,15 @@ def test_sst_form_gate_zeros_scores(monkeypatch):
     assert result["task"] == "summarize_spoken_text"
     assert result["analysis"]["gate_reason"] == "form_out_of_range"
     assert result["scores"]["total"]["score"] == 0
+
+
+def test_sst_similarity_matches_two_document_vectorizer():
+    sklearn_text = pytest.importorskip("sklearn.feature_extraction.text")
+    sklearn_pairwise = pytest.importorskip("sklearn.metrics.pairwise")
+    reference = "Urban heat islands form because concrete and asphalt absorb sunlight and release heat at night."
+    response = "The speaker says concrete and asphalt absorb heat, so cities stay warmer at night than rural areas."
+
+    matrix = sklearn_text.TfidfVectorizer(stop_words="english").fit_transform([reference, response])
+    expected = sklearn_pairwise.cosine_similarity(matrix[0:1], matrix[1:2])[0][0]
+
+    assert listening_module._sst_similarity(reference, response) == pytest.approx(expected)
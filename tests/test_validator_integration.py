@@ -1,5 +1,10 @@
+import os
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 import api.validator as validator_module
 
 
@@ -156,6 +161,42 @@ def test_align_and_validate_reuses_cached_result(tmp_path, monkeypatch):
     assert second_result["meta"]["cache"]["hit"] is True
 
 
+def test_align_and_validate_accepts_in_memory_transcript(tmp_path, monkeypatch):
+    mfa_base_dir = tmp_path / "mfa"
+    mfa_runtime_dir = tmp_path / "mfa_runtime"
+    (mfa_base_dir / "data").mkdir(parents=True)
+    mfa_runtime_dir.mkdir(parents=True)
+    audio_path = tmp_path / "input.wav"
+    audio_path.write_bytes(b"RIFFFAKEAUDIO")
+    staged_texts = []
+
+    def fail_if_called(_path):
+        raise AssertionError("ASR should not run when a result is supplied")
+
+    monkeypatch.setattr(validator_module, "MFA_BASE_DIR", mfa_base_dir)
+    monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", mfa_runtime_dir)
+    monkeypatch.setattr(validator_module, "transcribe_audio_with_details", fail_if_called)
+    monkeypatch.setattr(validator_module, "compare_text", lambda _ref, _hyp: _mock_diff())
+
+    def fake_run_single_alignment_gen(accent, _conf, run_id, _docker_input_dir):
+        staged = mfa_runtime_dir / run_id / "input" / "input.txt"
+        staged_texts.append(staged.read_text(encoding="utf-8"))
+        yield {"type": "result", "data": (accent, None)}
+
+    monkeypatch.setattr(validator_module, "run_single_alignment_gen", fake_run_single_alignment_gen)
+
+    result = validator_module.align_and_validate(
+        str(audio_path),
+        None,
+        accents=["US_ARPA"],
+        reference_text="hello world",
+        asr_result=_mock_asr_result(),
+    )
+
+    assert staged_texts == ["hello world"]
+    assert result["summary"]["total"] == 2
+
+
 def test_align_and_validate_prefers_mfa_for_pause_timing(tmp_path, monkeypatch):
     mfa_base_dir = tmp_path / "mfa"
     mfa_runtime_dir = tmp_path / "mfa_runtime"
@@ -185,8 +226,9 @@ def test_align_and_validate_prefers_mfa_for_pause_timing(tmp_path, monkeypatch):
     monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", mfa_runtime_dir)
     monkeypatch.setattr(validator_module, "transcribe_audio_with_details", lambda _path: asr_result)
     monkeypatch.setattr(validator_module, "compare_text", lambda _ref, _hyp: _mock_diff_with_comma())
-    monkeypatch.setattr(validator_module, "read_textgrid_words", lambda _path: base_words)
-    monkeypatch.setattr(validator_module, "read_textgrid_phones", lambda _path: [])
+    monkeypatch.setattr(
+        validator_module, "read_textgrid", lambda _path, _tiers=None: ("", {"words": base_words, "phones": []})
+    )
 
     def fake_run_single_alignment_gen(accent, _conf, _run_id, _docker_input_dir):
         yield {"type": "result", "data": (accent, tg_path)}
@@ -265,3 +307,365 @@ def test_run_single_alignment_uses_configurable_num_jobs(tmp_path, monkeypatch):
     assert "--num_jobs" in captured["cmd"]
     num_jobs_index = captured["cmd"].index("--num_jobs")
     assert captured["cmd"][num_jobs_index + 1] == "3"
+
+
+def test_calculate_word_gaps_orders_by_start_and_skips_untimed_words():
+    words = [
+        {"word": "world", "start": 1.2, "end": 1.6},
+        {"word": "hello", "start": 0.0, "end": 0.5},
+        {"word": "um", "start": None, "end": None},
+        {"word": "again", "start": 1.6, "end": 2.0},
+    ]
+
+    gaps = validator_module.calculate_word_gaps(words, threshold=1e-4)
+
+    assert gaps == [
+        {
+            "after_word": "hello",
+            "before_word": "world",
+            "start": 0.5,
+            "end": 1.2,
+            "duration": 0.7,
+            "source": "mfa",
+        }
+    ]
+
+
+def test_compare_text_marks_omissions_and_insertions():
+    diff, transcript = validator_module.compare_text("The cat sat, on the mat.", "the cat sat on a mat")
+
+    assert transcript == "the cat sat on a mat"
+    assert [(item["word"], item["status"]) for item in diff] == [
+        ("the", "correct"),
+        ("cat", "correct"),
+        ("sat", "correct"),
+        (",", "omitted"),
+        ("on", "correct"),
+        ("the", "omitted"),
+        ("a", "inserted"),
+        ("mat", "correct"),
+        (".", "omitted"),
+    ]
+
+
+def test_compare_text_keeps_matches_a_min_edit_alignment_would_drop():
+    # A minimum-edit aligner scores ", sat" -> "sat y" as two substitutions, the same cost
+    # as omit-plus-insert, and drops the "sat" match; every spoken word must count as correct.
+    diff, _ = validator_module.compare_text("x the cat, sat", "the cat sat y")
+
+    assert [(item["word"], item["status"]) for item in diff] == [
+        ("x", "omitted"),
+        ("the", "correct"),
+        ("cat", "correct"),
+        (",", "omitted"),
+        ("sat", "correct"),
+        ("y", "inserted"),
+    ]
+
+
+def test_compare_text_normalizes_transcript_punctuation_like_the_reference():
+    diff, transcript = validator_module.compare_text("It rose 3.5 percent.", "it rose 3.5 , percent")
+
+    assert transcript == "it rose 35 percent"
+    assert [item["status"] for item in diff] == ["correct", "correct", "correct", "correct", "omitted"]
+
+
+def test_align_accents_concurrently_collects_each_accent(monkeypatch):
+    import threading
+
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_run_single_alignment_gen(accent, _conf, _run_id, _docker_input_dir, error_sink=None):
+        both_started.wait()  # Deadlocks (and times out) unless the accents run concurrently.
+        if accent == "UK":
+            error_sink[accent] = "boom"
+            yield {"type": "result", "data": (accent, None)}
+            return
+        yield {"type": "result", "data": (accent, f"/tmp/{accent}.TextGrid")}
+
+    monkeypatch.setattr(validator_module, "run_single_alignment_gen", fake_run_single_alignment_gen)
+
+    accent_tgs, mfa_errors = {}, {}
+    targets = {accent: validator_module.ACCENTS_CONFIG[accent] for accent in ("US_ARPA", "UK")}
+    list(validator_module._align_accents_concurrently(targets, "run1", "/runtime/run1/input", accent_tgs, mfa_errors, 2))
+
+    assert accent_tgs == {"US_ARPA": "/tmp/US_ARPA.TextGrid"}
+    assert mfa_errors == {"UK": "boom"}
+
+
+def test_align_accents_concurrently_stops_running_alignments_on_disconnect(monkeypatch):
+    closed = threading.Event()
+
+    def endless_alignment(accent, _conf, _run_id, _docker_input_dir, error_sink=None):
+        try:
+            while True:
+                time.sleep(0.01)
+                yield {"type": "progress", "percent": 30, "message": "Aligning..."}
+        finally:
+            closed.set()  # run_single_alignment_gen kills its docker process here.
+
+    monkeypatch.setattr(validator_module, "run_single_alignment_gen", endless_alignment)
+
+    targets = {accent: validator_module.ACCENTS_CONFIG[accent] for accent in ("US_ARPA", "UK")}
+    heartbeats = validator_module._align_accents_concurrently(targets, "run1", "/runtime/run1/input", {}, {}, 2)
+    assert next(heartbeats)["type"] == "progress"
+    heartbeats.close()
+
+    assert closed.wait(timeout=5)
+
+
+def test_read_textgrid_parses_words_and_phones_in_one_pass(tmp_path):
+    tg_path = tmp_path / "input.TextGrid"
+    tg_path.write_text(
+        "\n".join([
+            'File type = "ooTextFile"',
+            'Object class = "TextGrid"',
+            'item [1]:',
+            '    name = "words"',
+            '    intervals [1]:',
+            '        xmin = 0.0',
+            '        xmax = 0.4',
+            '        text = "hello"',
+            '    intervals [2]:',
+            '        xmin = 0.4',
+            '        xmax = 0.6',
+            '        text = ""',
+            'item [2]:',
+            '    name = "phones"',
+            '    intervals [1]:',
+            '        xmin = 0.0',
+            '        xmax = 0.1',
+            '        text = "HH"',
+        ]),
+        encoding="utf-8",
+    )
+
+    content, tiers = validator_module.read_textgrid(str(tg_path))
+
+    assert content == tg_path.read_text(encoding="utf-8")
+    assert [(item["word"], item["start"], item["end"]) for item in tiers["words"]] == [("hello", 0.0, 0.4)]
+    assert [item["label"] for item in tiers["phones"]] == ["HH"]
+    assert validator_module.read_textgrid_phones(str(tg_path)) == tiers["phones"]
+    assert validator_module.read_textgrid(str(tmp_path / "missing.TextGrid")) == ("", {"words": [], "phones": []})
+
+
+def test_phone_interval_lookup_with_starts_index_matches_linear_scan():
+    phones = []
+    clock = 0.0
+    for idx in range(40):
+        duration = 0.05 + (idx % 7) * 0.02
+        phones.append({"label": f"P{idx}", "start": round(clock, 3), "end": round(clock + duration, 3)})
+        clock += duration + (0.1 if idx % 9 == 0 else 0.0)
+    phone_starts = validator_module.build_phone_starts(phones)
+
+    for word_start in [x * 0.13 for x in range(30)]:
+        word = {"start": word_start, "end": word_start + 0.35}
+        assert validator_module.get_phone_intervals_for_word(
+            word, phones, phone_starts=phone_starts
+        ) == validator_module.get_phone_intervals_for_word(word, phones)
+
+    assert validator_module.build_phone_starts([{"start": 0.5, "end": 0.6}, {"start": 0.1, "end": 0.2}]) is None
+
+
+def test_reused_mfa_container_is_started_once(monkeypatch):
+    commands = []
+
+    class _Completed:
+        returncode = 0
+        stderr = b""
+
+    def fake_run(cmd, **_kwargs):
+        commands.append(cmd)
+        return _Completed()
+
+    monkeypatch.delenv("PTE_MFA_CONTAINER_NAME", raising=False)
+    monkeypatch.setenv("PTE_MFA_REUSE_CONTAINER", "1")
+    monkeypatch.setattr(validator_module, "_MFA_REUSED_CONTAINER", None)
+    monkeypatch.setattr(validator_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(validator_module.atexit, "register", lambda *_args: None)
+
+    first = validator_module._resolve_mfa_runner_mode()
+    second = validator_module._resolve_mfa_runner_mode()
+
+    assert first == second
+    assert first[0] == "docker_exec"
+    assert [cmd[:3] for cmd in commands] == [["docker", "run", "-d"]]
+    assert commands[0][commands[0].index("--name") + 1] == first[1]
+    assert f"-{validator_module.os.getpid()}-" in first[1]
+
+
+def test_docker_exec_alignment_uses_per_run_temporary_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", tmp_path / "mfa_runtime")
+    monkeypatch.setenv("PTE_MFA_CONTAINER_NAME", "shared-mfa")
+    captured = {}
+
+    class FakeProcess:
+        returncode = 1
+
+        def __init__(self, cmd):
+            captured["cmd"] = cmd
+
+        def communicate(self, timeout=None):
+            return None, b"failed"
+
+        def poll(self):
+            return self.returncode
+
+    monkeypatch.setattr(validator_module.subprocess, "Popen", lambda cmd, **_kwargs: FakeProcess(cmd))
+
+    list(validator_module.run_single_alignment_gen("UK", validator_module.ACCENTS_CONFIG["UK"], "run7", "/runtime/run7/input"))
+
+    assert captured["cmd"][:3] == ["docker", "exec", "shared-mfa"]
+    temp_index = captured["cmd"].index("--temporary_directory")
+    assert captured["cmd"][temp_index + 1] == "/runtime/run7/tmp/UK"
+
+
+def test_align_and_validate_skips_mfa_when_no_reference_word_matches(tmp_path, monkeypatch):
+    audio_path, text_path = _write_minimal_files(tmp_path)
+    monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", tmp_path / "mfa_runtime")
+    monkeypatch.setattr(
+        validator_module,
+        "compare_text",
+        lambda _ref, _hyp: (
+            [
+                {"word": "hello", "status": "omitted", "ref_index": 0, "trans_index": None},
+                {"word": "banana", "status": "inserted", "ref_index": None, "trans_index": 0},
+            ],
+            "banana",
+        ),
+    )
+
+    def unexpected_alignment(*_args, **_kwargs):
+        raise AssertionError("MFA should not run")
+
+    monkeypatch.setattr(validator_module, "run_single_alignment_gen", unexpected_alignment)
+
+    result = validator_module.align_and_validate(
+        audio_path, text_path, accents=["US_ARPA"], asr_result=_mock_asr_result()
+    )
+
+    assert result["summary"]["asr_only"] is True
+    assert result["summary"]["correct"] == 0
+    assert "no reference words" in result["summary"]["note"]
+
+
+def test_align_and_validate_transcribes_while_mfa_aligns(tmp_path, monkeypatch):
+    audio_path, text_path = _write_minimal_files(tmp_path)
+    monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", tmp_path / "mfa_runtime")
+    alignment_started = threading.Event()
+
+    def slow_asr(_path):
+        # Only returns once MFA is already running, so a sequential pipeline would time out here.
+        assert alignment_started.wait(timeout=5)
+        return {"text": "banana", "word_timestamps": []}
+
+    def fake_alignment(accent, _conf, _run_id, _docker_input_dir, error_sink=None):
+        alignment_started.set()
+        yield {"type": "result", "data": (accent, None)}
+
+    monkeypatch.setattr(validator_module, "transcribe_audio_with_details", slow_asr)
+    monkeypatch.setattr(validator_module, "run_single_alignment_gen", fake_alignment)
+
+    result = validator_module.align_and_validate(audio_path, text_path, accents=["US_ARPA"])
+
+    assert result["transcript"] == "banana"
+    assert result["summary"]["asr_only"] is True
+    assert "no reference words" in result["summary"]["note"]
+
+
+def test_textgrid_cache_restores_alignment_and_prunes_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", tmp_path / "mfa_runtime")
+    monkeypatch.setenv("PTE_MFA_TEXTGRID_CACHE_MAX_ENTRIES", "2")
+    aligned = tmp_path / "aligned.TextGrid"
+    aligned.write_text("File type = \"ooTextFile\"", encoding="utf-8")
+    keys = [validator_module._build_textgrid_cache_key("abc", "hello world", accent) for accent in ("US_ARPA", "UK", "Indian")]
+    assert len(set(keys)) == 3
+
+    restored = tmp_path / "run" / "output" / "US_ARPA" / "input.TextGrid"
+    assert validator_module._restore_cached_textgrid(keys[0], restored) is False
+
+    validator_module._store_cached_textgrid(keys[0], aligned)
+    assert validator_module._restore_cached_textgrid(keys[0], restored) is True
+    assert restored.read_text(encoding="utf-8") == aligned.read_text(encoding="utf-8")
+    assert not os.path.samefile(restored, validator_module._textgrid_cache_dir() / f"{keys[0]}.TextGrid")
+
+    cache_dir = validator_module._textgrid_cache_dir()
+    os.utime(cache_dir / f"{keys[0]}.TextGrid", (1, 1))
+    validator_module._store_cached_textgrid(keys[1], aligned)
+    os.utime(cache_dir / f"{keys[1]}.TextGrid", (2, 2))
+    validator_module._store_cached_textgrid(keys[2], aligned)
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == sorted(f"{key}.TextGrid" for key in keys[1:])
+
+
+class _InlineExecutor:
+    def submit(self, fn, *args):
+        future = validator_module.concurrent.futures.Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_align_and_validate_skips_docker_when_background_asr_already_found_nothing(tmp_path, monkeypatch):
+    audio_path, text_path = _write_minimal_files(tmp_path)
+    monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", tmp_path / "mfa_runtime")
+    monkeypatch.setattr(validator_module, "_get_asr_executor", lambda: _InlineExecutor())
+    monkeypatch.setattr(
+        validator_module, "transcribe_audio_with_details", lambda _path: {"text": "banana", "word_timestamps": []}
+    )
+
+    def unexpected_alignment(*_args, **_kwargs):
+        raise AssertionError("MFA should not run")
+
+    monkeypatch.setattr(validator_module, "run_single_alignment_gen", unexpected_alignment)
+
+    result = validator_module.align_and_validate(audio_path, text_path, accents=["US_ARPA"])
+
+    assert result["summary"]["asr_only"] is True
+    assert "no reference words" in result["summary"]["note"]
+
+
+def test_align_and_validate_stops_mfa_when_background_asr_finds_nothing(tmp_path, monkeypatch):
+    audio_path, text_path = _write_minimal_files(tmp_path)
+    monkeypatch.setattr(validator_module, "MFA_RUNTIME_DIR", tmp_path / "mfa_runtime")
+    alignment_started = threading.Event()
+    alignment_closed = threading.Event()
+
+    def slow_asr(_path):
+        assert alignment_started.wait(timeout=5)
+        return {"text": "banana", "word_timestamps": []}
+
+    def long_alignment(accent, _conf, _run_id, _docker_input_dir, error_sink=None):
+        alignment_started.set()
+        try:
+            for _ in range(500):
+                time.sleep(0.01)
+                yield {"type": "progress", "percent": 30, "message": "Aligning..."}
+            yield {"type": "result", "data": (accent, None)}
+        finally:
+            alignment_closed.set()
+
+    monkeypatch.setattr(validator_module, "transcribe_audio_with_details", slow_asr)
+    monkeypatch.setattr(validator_module, "run_single_alignment_gen", long_alignment)
+
+    started = time.monotonic()
+    result = validator_module.align_and_validate(audio_path, text_path, accents=["US_ARPA"])
+
+    assert alignment_closed.is_set()
+    assert time.monotonic() - started < 4
+    assert "no reference words" in result["summary"]["note"]
+
+
+def test_validate_pronunciation_checks_phonemes_then_stress():
+    dictionary = {"record": [("r", "eh1", "k", "er0", "d"), ("r", "ih0", "k", "ao1", "r", "d")]}
+
+    assert validator_module.validate_pronunciation("Record", ["sil", "R", "EH1", "K", "ER0", "D", "sp"], dictionary) == (
+        True, "Exact Match (With Stress)", True,
+    )
+    assert validator_module.validate_pronunciation("record", ["r", "eh", "k", "er", "d"], dictionary) == (
+        True, "Exact Match (No Stress Info)", True,
+    )
+    assert validator_module.validate_pronunciation("record", ["r", "eh0", "k", "er1", "d"], dictionary) == (
+        True, "Stress Mismatch", False,
+    )
+    assert validator_module.validate_pronunciation("record", ["r", "eh", "k"], dictionary) == (False, "Mismatch", False)
+    assert validator_module.validate_pronunciation("record", ["sil"], dictionary) == (False, "No phones detected", False)
@@ -0,0 +1,52 @@
+import io
+import wave
+
+import numpy as np
+
+import pte_core.asr.voice2text as voice2text_module
+
+
+def _write_wav_with_pause(path, pause_at, seconds=10.0, rate=16000):
+    t = np.arange(int(seconds * rate)) / rate
+    tone = np.sin(2 * np.pi * 220 * t) * 0.3 * 32767
+    tone[int(pause_at * rate):int((pause_at + 0.3) * rate)] = 0
+    with wave.open(str(path), "wb") as out_file:
+        out_file.setnchannels(1)
+        out_file.setsampwidth(2)
+        out_file.setframerate(rate)
+        out_file.writeframes(tone.astype("<i2").tobytes())
+
+
+def test_split_wav_on_pauses_cuts_inside_the_pause(tmp_path):
+    audio = tmp_path / "long.wav"
+    _write_wav_with_pause(audio, pause_at=3.5)
+
+    chunks = voice2text_module._split_wav_on_pauses(str(audio), chunk_seconds=5.0, search_seconds=2.0)
+
+    offsets = [offset for offset, _ in chunks]
+    assert offsets[0] == 0.0
+    assert 3.5 <= offsets[1] <= 3.8
+    assert offsets[-1] < 10.0
+    assert voice2text_module._split_wav_on_pauses(str(audio), chunk_seconds=30.0) is None
+
+
+def test_voice2text_merges_chunk_transcripts_with_offsets(tmp_path, monkeypatch):
+    audio = tmp_path / "long.wav"
+    _write_wav_with_pause(audio, pause_at=3.5)
+    monkeypatch.setenv("PTE_ASR_CHUNK_SECONDS", "5")
+    monkeypatch.setenv("PTE_ASR_CACHE_SIZE", "0")
+
+    def fake_post(audio_part):
+        _, data, _ = audio_part
+        with wave.open(io.BytesIO(data), "rb") as chunk:
+            duration = chunk.getnframes() / chunk.getframerate()
+        return {"text": f"{duration:.1f}", "word_timestamps": [{"word": "w", "start": 0.5, "end": 1.0}]}
+
+    monkeypatch.setattr(voice2text_module, "_post_audio", fake_post)
+
+    result = voice2text_module.voice2text(str(audio))
+
+    offsets = [offset for offset, _ in voice2text_module._split_wav_on_pauses(str(audio), 5.0)]
+    assert len(result["word_timestamps"]) == len(offsets)
+    assert [w["start"] for w in result["word_timestamps"]] == [offset + 0.5 for offset in offsets]
+    assert len(result["text"].split()) == len(offsets)